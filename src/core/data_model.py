@@ -15,7 +15,7 @@ IEC61850 Data Model Implementation
 
 from __future__ import annotations
 
-from sys import prefix
+from sys import intern, prefix
 import uuid
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
@@ -991,14 +991,14 @@ class IED(IEC61850Element):
 			return None
 	
 	def get_all_references(self) -> List[str]:
-		"""获取所有数据属性引用"""
+		"""获取所有数据属性引用（引用字符串经 intern 驻留，供界面按引用反复查找）"""
 		refs = []
 		for ld in self.get_logical_devices():
 			for ln in ld.logical_nodes.values():
 				for do in ln.data_objects:
 					for da in do.attributes:
 						if isinstance(da, DataAttribute):
-							refs.append(da.reference)
+							refs.append(intern(da.reference))
 		return refs
 
 	def get_listen_ip(self, default: str = "0.0.0.0") -> str:
@@ -50,18 +50,11 @@ class SCDParser:
 			tree = ET.parse(scd_path)
 			root = tree.getroot()
 			
-			loaded_ieds = []
 			self._dataTypeTemplate_element = self._find_element(root, 'DataTypeTemplates')
 			self._communication_element = self._find_element(root, 'Communication')
 
 			# 使用通配符方式查找 IED 元素，忽略命名空间
-			for ied_elem in root.findall('./{*}IED'):
-				ied = self._parse_ied_from_scd(ied_elem)
-				logger.info(f"Parsed IED: {ied.name if ied else 'None'}")
-				if ied:
-					# 解析通信参数并关联到 AccessPoint
-					self._apply_communication_params(ied)
-					loaded_ieds.append(ied)
+			loaded_ieds = self.build_ieds(root.findall('./{*}IED'))
 
 			logger.info(f"Successfully loaded {len(loaded_ieds)} IED(s) from SCD file: {scd_path}")
 			
@@ -70,6 +63,58 @@ class SCDParser:
 		except Exception as e:
 			logger.error(f"Failed to load SCD file {scd_path}: {e}")
 			return []
+
+	def split_ieds(self, scd_path: Union[str, Path]) -> List[ET.Element]:
+		"""
+		单次 iterparse 扫描 SCD 文件，返回各 IED 子树
+		
+		同时缓存 Communication 与 DataTypeTemplates 节点，Header、Substation 等
+		其余顶层子树读取结束后立即 clear()，降低大型 SCD 文件的峰值内存。
+		返回的元素交给 build_ieds() 构建 IED 对象。
+		
+		Args:
+			scd_path: SCD 文件路径
+			
+		Returns:
+			IED 元素列表
+		"""
+		ied_elems = []
+		self._dataTypeTemplate_element = None
+		self._communication_element = None
+
+		depth = 0
+		for event, elem in ET.iterparse(scd_path, events=('start', 'end')):
+			if event == 'start':
+				depth += 1
+				continue
+			depth -= 1
+			if depth != 1:
+				continue
+
+			# 根节点的直接子元素读取完毕
+			local_name = elem.tag.rpartition('}')[2]
+			if local_name == 'IED':
+				ied_elems.append(elem)
+			elif local_name == 'DataTypeTemplates':
+				self._dataTypeTemplate_element = elem
+			elif local_name == 'Communication':
+				self._communication_element = elem
+			else:
+				elem.clear()
+
+		return ied_elems
+
+	def build_ieds(self, ied_elems: List[ET.Element]) -> List[IED]:
+		"""由 IED 元素列表构建 IED 对象，并关联通信参数"""
+		loaded_ieds = []
+		for ied_elem in ied_elems:
+			ied = self._parse_ied_from_scd(ied_elem)
+			logger.info(f"Parsed IED: {ied.name if ied else 'None'}")
+			if ied:
+				# 解析通信参数并关联到 AccessPoint
+				self._apply_communication_params(ied)
+				loaded_ieds.append(ied)
+		return loaded_ieds
 	
 	def _parse_ied_from_scd(self, ied_elem: ET.Element,) -> Optional[IED]:
 		"""从 SCD XML 元素解析 IED"""
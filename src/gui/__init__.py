@@ -3,24 +3,32 @@ IEC61850 Simulator GUI Module
 =============================
 
 PyQt6 GUI界面模块
+
+各组件在首次访问时才导入对应子模块，导入 gui 包（如 gui.main_window）
+不会连带加载全部面板
 """
 
-from .main_window import MainWindow
-from .server_panel import ServerPanel
-from .client_panel import ClientPanel
-from .multi_server_panel import MultiServerPanel
-from .multi_client_panel import MultiClientPanel
-from .instance_list_widget import InstanceListWidget
-from .data_tree_widget import DataTreeWidget
-from .log_widget import LogWidget
+import importlib
+
+# 导出名称 -> 所在子模块
+_EXPORTS = {
+    "MainWindow": ".main_window",
+    "ServerPanel": ".server_panel",
+    "ClientPanel": ".client_panel",
+    "MultiServerPanel": ".multi_server_panel",
+    "MultiClientPanel": ".multi_client_panel",
+    "InstanceListWidget": ".instance_list_widget",
+    "DataTreeWidget": ".data_tree_widget",
+    "LogWidget": ".log_widget",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "MainWindow",
-    "ServerPanel",
-    "ClientPanel",
-    "MultiServerPanel",
-    "MultiClientPanel",
-    "InstanceListWidget",
-    "DataTreeWidget",
-    "LogWidget",
-]
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -9,27 +9,49 @@ Client Panel
 from __future__ import annotations
 
 import sys
+import weakref
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QObject, QThread, QCoreApplication
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QTableWidgetItem, QHeaderView,
     QMessageBox, QDialog, QListWidgetItem
 )
-from PyQt6 import uic
+from PyQt6.QtGui import QCloseEvent
+from PyQt6 import sip, uic
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_SRC_ROOT = str(Path(__file__).parent.parent)
+if _SRC_ROOT not in sys.path:
+    sys.path.insert(0, _SRC_ROOT)
 
-from gui.data_tree_widget import DataTreeWidget
+from gui.data_tree_widget import DataTreeWidget, parse_value_text
 from client.client_proxy import IEC61850ClientProxy, ClientConfig, ClientState
 
 # UI文件路径
 UI_DIR = Path(__file__).parent / "ui"
 
+# UI文件在导入时编译一次，每次实例化（每个客户端实例、每次打开对话框）只调用生成的 setupUi
+_ConnectionDialogForm, _ = uic.loadUiType(UI_DIR / "connection_dialog.ui")
+_ClientPanelForm, _ = uic.loadUiType(UI_DIR / "client_panel.ui")
 
-class ConnectionDialog(QDialog):
+
+def _wrap_browsed_attribute(name: str) -> Dict:
+    """将浏览结果中的属性名包装为data_tree所需的属性字典"""
+    return {"name": name, "type": "Unknown", "value": ""}
+
+
+def _stop_thread(thread: QThread, *_):
+    """结束并等待工作线程（面板被销毁时调用）"""
+    if sip.isdeleted(thread):
+        return
+    thread.quit()
+    thread.wait()
+
+
+class ConnectionDialog(QDialog, _ConnectionDialogForm):
     """连接对话框"""
     
     def __init__(self, saved_servers: List[Dict], parent=None):
@@ -37,14 +59,20 @@ class ConnectionDialog(QDialog):
         
         self.saved_servers = saved_servers
         
-        # 加载UI文件
-        uic.loadUi(UI_DIR / "connection_dialog.ui", self)
+        # 构建UI
+        self.setupUi(self)
         
-        # 填充保存的服务器列表
-        for server in saved_servers:
-            item = QListWidgetItem(f"{server['name']} ({server['ip']}:{server['port']})")
-            item.setData(Qt.ItemDataRole.UserRole, server)
-            self.serverList.addItem(item)
+        # 填充保存的服务器列表（批量插入期间暂停重绘与信号）
+        self.serverList.setUpdatesEnabled(False)
+        self.serverList.blockSignals(True)
+        try:
+            for server in saved_servers:
+                item = QListWidgetItem(f"{server['name']} ({server['ip']}:{server['port']})")
+                item.setData(Qt.ItemDataRole.UserRole, server)
+                self.serverList.addItem(item)
+        finally:
+            self.serverList.blockSignals(False)
+            self.serverList.setUpdatesEnabled(True)
         
         # 连接信号
         self.serverList.itemDoubleClicked.connect(self._on_server_selected)
@@ -66,7 +94,68 @@ class ConnectionDialog(QDialog):
         }
 
 
-class ClientPanel(QWidget):
+class ClientWorker(QObject):
+    """
+    客户端IO工作对象
+    
+    运行在独立线程中，按请求到达顺序串行调用同步客户端接口，
+    结果通过信号（跨线程排队连接）返回界面线程。
+    每个请求携带发起时的请求代次 (generation)，结果原样带回，由界面线程丢弃过期结果。
+    """
+    
+    connected = pyqtSignal(int, bool, str, int)  # generation, success, ip, port
+    browsed = pyqtSignal(int, object)  # generation, model
+    values_ready = pyqtSignal(int, object)  # generation, {reference: DataValue}
+    value_ready = pyqtSignal(int, str, object)  # generation, reference, DataValue
+    write_done = pyqtSignal(int, str, object, bool)  # generation, reference, value, success
+    
+    def __init__(self):
+        super().__init__()
+        self.client: Optional[IEC61850ClientProxy] = None
+    
+    @pyqtSlot(int, str, int, str)
+    def connect_requested(self, generation: int, ip: str, port: int, name: str):
+        """连接服务器"""
+        success = bool(self.client and self.client.connect(ip, port, name))
+        self.connected.emit(generation, success, ip, port)
+    
+    @pyqtSlot()
+    def disconnect_requested(self):
+        """断开连接"""
+        if self.client:
+            self.client.disconnect()
+    
+    @pyqtSlot()
+    def stop_requested(self):
+        """结束工作线程（排在此前的请求之后执行）"""
+        QThread.currentThread().quit()
+    
+    @pyqtSlot(int)
+    def browse_requested(self, generation: int):
+        """浏览数据模型"""
+        model = self.client.browse_data_model() if self.client else None
+        self.browsed.emit(generation, model)
+    
+    @pyqtSlot(int, list)
+    def read_requested(self, generation: int, references: List[str]):
+        """批量读取"""
+        values = self.client.read_values(references) if self.client else {}
+        self.values_ready.emit(generation, values)
+    
+    @pyqtSlot(int, str)
+    def read_value_requested(self, generation: int, reference: str):
+        """读取单个值"""
+        if self.client:
+            self.value_ready.emit(generation, reference, self.client.read_value(reference))
+    
+    @pyqtSlot(int, str, object)
+    def write_requested(self, generation: int, reference: str, value):
+        """写入值"""
+        success = bool(self.client and self.client.write_value(reference, value))
+        self.write_done.emit(generation, reference, value, success)
+
+
+class ClientPanel(QWidget, _ClientPanelForm):
     """
     客户端面板
     
@@ -79,21 +168,75 @@ class ClientPanel(QWidget):
     """
     
     log_message = pyqtSignal(str, str)  # level, message
+    connection_finished = pyqtSignal(bool)  # 连接请求完成（是否成功）
+    
+    # 发往工作线程的请求（首个参数为请求代次）
+    _connect_requested = pyqtSignal(int, str, int, str)
+    _disconnect_requested = pyqtSignal()
+    _browse_requested = pyqtSignal(int)
+    _read_requested = pyqtSignal(int, list)
+    _read_value_requested = pyqtSignal(int, str)
+    _write_requested = pyqtSignal(int, str, object)
+    _stop_requested = pyqtSignal()
+    
+    # 用于线程安全的客户端回调
+    _state_changed_signal = pyqtSignal(object)
+    _data_changed_signal = pyqtSignal(str, object)
+    
+    # 状态显示文本与颜色映射
+    STATE_TEXT = {
+        ClientState.DISCONNECTED: ("未连接", "#6c757d"),
+        ClientState.CONNECTING: ("正在连接...", "#ffc107"),
+        ClientState.CONNECTED: ("已连接", "#28a745"),
+        ClientState.DISCONNECTING: ("正在断开...", "#ffc107"),
+        ClientState.ERROR: ("错误", "#dc3545"),
+    }
+    
+    # 状态标签样式表：按 state 动态属性选择颜色，只设置一次，状态变化时仅重新 polish
+    _STATUS_LABEL_STYLE = "QLabel { color: #666; font-size: 11px; }\n" + "\n".join(
+        f'QLabel[state="{state.name}"] {{ color: {color}; }}'
+        for state, (_, color) in STATE_TEXT.items()
+    )
+    
+    # 连接/断开进行中的状态：期间不允许再次发起连接
+    TRANSITION_STATES = (ClientState.CONNECTING, ClientState.DISCONNECTING)
+    
+    # 刷新时每次批量读取的引用数
+    READ_CHUNK_SIZE = 128
+    
+    # 仅在已连接时可用的控件
+    CONNECTED_WIDGETS = (
+        "disconnectBtn", "browseBtn", "refreshBtn", "readBtn",
+        "writeBtn", "subscribeBtn", "unsubscribeBtn",
+    )
     
     def __init__(self, config: Dict, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
         self.config = config
-        self.client: Optional[IEC61850ClientProxy] = None
+        self._client: Optional[IEC61850ClientProxy] = None
+        # 已注册过回调的客户端（面板可在多个实例的客户端之间切换，每个客户端只注册一次）
+        self._hooked_clients: "weakref.WeakSet[IEC61850ClientProxy]" = weakref.WeakSet()
         self.saved_servers: List[Dict] = []
-        
-        # 加载UI文件
-        uic.loadUi(UI_DIR / "client_panel.ui", self)
+        self._all_refs: List[str] = []  # 浏览得到的全部叶子引用
+        self._connected = False
+        self._read_pending = 0  # 刷新时尚未返回的分块数
+        self._read_count = 0
+        self._refresh_after_browse = False
+        # 请求代次：切换实例或断开时递增，工作线程返回的过期结果被丢弃
+        self._generation = 0
+        self._shown_state: Optional[ClientState] = None
+        # 当前绑定的实例ID（多实例共享面板时使用）
+        self._instance_id: Optional[str] = None
+        
+        # 构建UI
+        self.setupUi(self)
         
         self._init_ui()
+        self._init_worker()
+        self._setup_timers()
         self._init_client()
         self._connect_signals()
-        self._setup_timers()
     
     def _init_ui(self):
         """初始化UI附加设置"""
@@ -102,6 +245,8 @@ class ClientPanel(QWidget):
         self.mainSplitter.setStretchFactor(0, 1)
         self.mainSplitter.setStretchFactor(1, 2)
         
+        self.statusLabel.setStyleSheet(self._STATUS_LABEL_STYLE)
+        
         # 设置数据表格表头
         self.dataTable.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         
@@ -136,8 +281,128 @@ class ClientPanel(QWidget):
         self.data_tree.item_selected.connect(self._on_item_selected)
         self.data_tree.item_double_clicked.connect(self._on_item_double_clicked)
     
+    def _init_worker(self):
+        """创建客户端工作线程，所有阻塞的客户端调用都在该线程中执行"""
+        self._worker = ClientWorker()
+        # 线程不作为面板的子对象：面板被销毁时先经 destroyed 结束线程，
+        # 避免线程仍在运行时随面板一起被删除
+        self._thread = QThread()
+        self._worker.moveToThread(self._thread)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self.destroyed.connect(partial(_stop_thread, self._thread))
+        
+        # 请求：界面线程 -> 工作线程
+        self._connect_requested.connect(self._worker.connect_requested)
+        self._disconnect_requested.connect(self._worker.disconnect_requested)
+        self._browse_requested.connect(self._worker.browse_requested)
+        self._read_requested.connect(self._worker.read_requested)
+        self._read_value_requested.connect(self._worker.read_value_requested)
+        self._write_requested.connect(self._worker.write_requested)
+        self._stop_requested.connect(self._worker.stop_requested)
+        
+        # 结果：工作线程 -> 界面线程
+        self._worker.connected.connect(self._on_connect_done)
+        self._worker.browsed.connect(self._on_browse_done)
+        self._worker.values_ready.connect(self._on_values_ready)
+        self._worker.value_ready.connect(self._on_value_read)
+        self._worker.write_done.connect(self._on_write_done)
+        
+        # 客户端回调
+        self._state_changed_signal.connect(self._on_client_state_changed)
+        self._data_changed_signal.connect(self._on_data_changed)
+        
+        self._thread.start()
+        QCoreApplication.instance().aboutToQuit.connect(self.shutdown)
+    
+    @property
+    def client(self) -> Optional[IEC61850ClientProxy]:
+        return self._client
+    
+    @client.setter
+    def client(self, client: Optional[IEC61850ClientProxy]):
+        if client is self._client:
+            return
+        self._client = client
+        self._worker.client = client
+        if client is None:
+            return
+        
+        # 连接回调（回调在工作线程中触发，经信号转到界面线程）；
+        # 同一客户端只注册一次，避免状态变化被重复处理
+        if client in self._hooked_clients:
+            return
+        self._hooked_clients.add(client)
+        client.on_state_change(partial(self._relay_client_callback, client, self._state_changed_signal.emit))
+        client.on_data_change(partial(self._relay_client_callback, client, self._data_changed_signal.emit))
+        client.on_log(partial(self._relay_client_callback, client, self.log_message.emit))
+    
+    def _relay_client_callback(self, client: IEC61850ClientProxy, emit, *args):
+        """转发客户端回调，只转发当前绑定的客户端"""
+        if client is self._client:
+            emit(*args)
+    
+    def bind_instance(self, instance_id: str, client_proxy: IEC61850ClientProxy,
+                      state: ClientState, config: Dict, host: str, port: int) -> None:
+        """
+        绑定到指定实例（用于多实例共享单个面板）
+        
+        客户端代理是进程内单例，所有实例共用同一个代理，
+        因此实例自身的状态与配置由调用方传入，不从代理读取。
+        config 为以实例 client 部分覆盖应用配置的映射；
+        已绑定同一实例时不重建数据视图，也不重新浏览
+        """
+        if instance_id == self._instance_id:
+            return
+        self._instance_id = instance_id
+        
+        self._reset_data_views()
+        self.client = client_proxy
+        self.config = config
+        self._apply_client_config()
+        
+        self.ipInput.setText(host)
+        self.portInput.setValue(port)
+        
+        self._connected = state == ClientState.CONNECTED
+        self._set_connected_ui(self._connected)
+        self._on_client_state_changed(state)
+        if self._connected:
+            self._browse_data_model()
+    
+    def unbind_instance(self) -> None:
+        """解除与当前实例的绑定（实例被移除时调用），清空数据视图"""
+        self._instance_id = None
+        self._reset_data_views()
+    
+    def shutdown(self):
+        """
+        停止轮询并结束工作线程
+        
+        退出请求排在已提交的请求（例如断开连接）之后，处理完后线程才退出；
+        面板关闭、主窗口关闭和应用退出时都会调用，可重复调用
+        """
+        self.polling_timer.stop()
+        if self._thread.isRunning():
+            self._stop_requested.emit()
+            self._thread.wait()
+    
+    def closeEvent(self, event: QCloseEvent):
+        """关闭面板时结束工作线程"""
+        self.shutdown()
+        super().closeEvent(event)
+    
     def _init_client(self):
         """初始化客户端"""
+        config = self._apply_client_config()
+        
+        ipc_config = self.config.get("ipc", {})
+        socket_path = ipc_config.get("socket_path", "/tmp/iec61850_simulator.sock")
+        timeout_ms = ipc_config.get("request_timeout_ms", 3000)
+
+        self.client = IEC61850ClientProxy(config, socket_path, timeout_ms)
+    
+    def _apply_client_config(self) -> ClientConfig:
+        """按 self.config 的 client 部分更新保存的服务器、轮询间隔与连接设置"""
         client_config = self.config.get("client", {})
         
         config = ClientConfig(
@@ -147,23 +412,15 @@ class ClientPanel(QWidget):
             polling_interval_ms=client_config.get("subscription", {}).get("polling_interval_ms", 1000),
             auto_reconnect=True,
         )
-        
-        ipc_config = self.config.get("ipc", {})
-        socket_path = ipc_config.get("socket_path", "/tmp/iec61850_simulator.sock")
-        timeout_ms = ipc_config.get("request_timeout_ms", 3000)
-
-        self.client = IEC61850ClientProxy(config, socket_path, timeout_ms)
-        
-        # 连接回调
-        self.client.on_state_change(self._on_client_state_changed)
-        self.client.on_data_change(self._on_data_changed)
-        self.client.on_log(lambda level, msg: self.log_message.emit(level, msg))
+        self._client_config = config
         
         # 获取保存的服务器列表
         self.saved_servers = client_config.get("saved_servers", [])
         
         # 更新UI
         self.timeoutInput.setValue(config.timeout_ms)
+        self.polling_timer.setInterval(config.polling_interval_ms)
+        return config
     
     def _setup_timers(self):
         """设置定时器"""
@@ -187,49 +444,71 @@ class ClientPanel(QWidget):
             QMessageBox.warning(self, "警告", "请输入IP地址")
             return False
         
-        # 更新配置
-        self.client.config.timeout_ms = self.timeoutInput.value()
-        self.client.config.auto_reconnect = self.autoReconnectCheck.isChecked()
+        # 更新配置（代理为各实例共用，重试设置取自当前绑定的配置）
+        config = self.client.config
+        config.timeout_ms = self.timeoutInput.value()
+        config.retry_count = self._client_config.retry_count
+        config.retry_interval_ms = self._client_config.retry_interval_ms
+        config.polling_interval_ms = self._client_config.polling_interval_ms
+        config.auto_reconnect = self.autoReconnectCheck.isChecked()
+        
+        # 连接在工作线程中进行，返回 True 仅表示请求已提交；
+        # 结果由 _on_connect_done 处理并经 connection_finished 通知
+        self.connectBtn.setEnabled(False)
+        self._disable_conn_inputs(True)
+        self._connect_requested.emit(self._generation, ip, port, "连接")
+        return True
+    
+    def _on_connect_done(self, generation: int, success: bool, ip: str, port: int):
+        """连接结果"""
+        if generation != self._generation:
+            return
         
-        if self.client.connect(ip, port, "连接"):
-            self.connectBtn.setEnabled(False)
-            self.disconnectBtn.setEnabled(True)
-            self.browseBtn.setEnabled(True)
-            self.refreshBtn.setEnabled(True)
-            self.readBtn.setEnabled(True)
-            self.writeBtn.setEnabled(True)
-            self.subscribeBtn.setEnabled(True)
-            self.unsubscribeBtn.setEnabled(True)
-            self._disable_conn_inputs(True)
+        if success:
+            self._connected = True
+            self._set_connected_ui(True)
+            self.connection_finished.emit(True)
             
             # 浏览数据模型
             self._browse_data_model()
-            
-            return True
+            return
         
+        self._set_connected_ui(False)
+        self.connection_finished.emit(False)
         QMessageBox.critical(self, "错误", f"连接失败: {ip}:{port}")
-        return False
     
     def disconnect(self):
         """断开连接"""
         if self.client:
-            self.client.disconnect()
-            
-            self.connectBtn.setEnabled(True)
-            self.disconnectBtn.setEnabled(False)
-            self.browseBtn.setEnabled(False)
-            self.refreshBtn.setEnabled(False)
-            self.readBtn.setEnabled(False)
-            self.writeBtn.setEnabled(False)
-            self.subscribeBtn.setEnabled(False)
-            self.unsubscribeBtn.setEnabled(False)
-            self._disable_conn_inputs(False)
+            self._connected = False
+            self._disconnect_requested.emit()
             
-            # 清空数据
-            self.data_tree.tree.clear()
-            
-            # 停止轮询
-            self.polling_timer.stop()
+            self._set_connected_ui(False)
+            self._reset_data_views()
+    
+    def _reset_data_views(self):
+        """清空数据视图并停止轮询，此前发出的请求的结果将被丢弃"""
+        self._generation += 1
+        
+        # 清空数据
+        self.data_tree.clear()
+        self._all_refs = []
+        self._read_pending = 0
+        self._refresh_after_browse = False
+        
+        # 停止轮询
+        self.polling_timer.stop()
+    
+    def _set_connected_ui(self, connected: bool):
+        """根据连接状态批量切换控件可用性"""
+        self.setUpdatesEnabled(False)
+        try:
+            self.connectBtn.setEnabled(not connected)
+            for name in self.CONNECTED_WIDGETS:
+                getattr(self, name).setEnabled(connected)
+            self._disable_conn_inputs(connected)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def _disable_conn_inputs(self, disabled: bool):
         """禁用/启用连接输入"""
@@ -254,84 +533,82 @@ class ClientPanel(QWidget):
     
     def _browse_data_model(self):
         """浏览数据模型"""
-        if not self.client or not self.client.is_connected():
+        if not self.client or not self._connected:
+            return
+        
+        self._all_refs = []
+        self._browse_requested.emit(self._generation)
+    
+    def _on_browse_done(self, generation: int, model):
+        """浏览结果"""
+        if generation != self._generation or not self._connected:
             return
         
-        model = self.client.browse_data_model()
         if model:
-            # 转换为data_tree需要的格式
-            tree_data = {
-                "name": model.get("ied_name", "IED"),
-                "logical_devices": {}
-            }
-            
-            for ld_name, ld_data in model.get("logical_devices", {}).items():
-                tree_data["logical_devices"][ld_name] = {
-                    "description": ld_data.get("description", ""),
-                    "logical_nodes": {}
-                }
-                
-                for ln_name, ln_data in ld_data.get("logical_nodes", {}).items():
-                    tree_data["logical_devices"][ld_name]["logical_nodes"][ln_name] = {
-                        "class": ln_data.get("class", ""),
-                        "description": ln_data.get("description", ""),
-                        "data_objects": {}
-                    }
-                    
-                    for do_name, do_data in ln_data.get("data_objects", {}).items():
-                        tree_data["logical_devices"][ld_name]["logical_nodes"][ln_name]["data_objects"][do_name] = {
-                            "cdc": do_data.get("cdc", ""),
-                            "description": do_data.get("description", ""),
-                            "attributes": {
-                                attr: {"name": attr, "type": "Unknown", "value": ""}
-                                for attr in do_data.get("attributes", [])
-                            }
-                        }
+            self.data_tree.load_ied(model, attr_wrap=_wrap_browsed_attribute)
             
-            self.data_tree.load_ied(tree_data)
+            # 记录全部叶子引用，刷新时无需再次浏览和遍历模型
+            self._all_refs = self.data_tree.get_references()
             self.log_message.emit("info", "数据模型加载完成")
+        
+        if self._refresh_after_browse:
+            self._refresh_after_browse = False
+            self._read_all_data()
     
     def _read_all_data(self):
-        """读取所有数据"""
-        if not self.client or not self.client.is_connected():
+        """读取所有数据（分块提交到工作线程，每块返回后逐步刷新界面）"""
+        if not self.client or not self._connected or self._read_pending:
             return
         
-        model = self.client.browse_data_model()
-        if not model:
+        references = self._all_refs
+        if not references:
+            # 尚未浏览，浏览完成后再刷新
+            self._refresh_after_browse = True
+            self._browse_data_model()
             return
         
-        references = []
-        ied_name = model.get("ied_name", "")
+        size = self.READ_CHUNK_SIZE
+        self._read_count = 0
+        for i in range(0, len(references), size):
+            self._read_pending += 1
+            self._read_requested.emit(self._generation, references[i:i + size])
+    
+    def _on_values_ready(self, generation: int, values: Dict):
+        """批量读取结果"""
+        if generation != self._generation or not self._read_pending:
+            return
+        self._read_pending -= 1
+        self._apply_read_values(values)
+        self._read_count += len(values)
         
-        for ld_name, ld_data in model.get("logical_devices", {}).items():
-            for ln_name, ln_data in ld_data.get("logical_nodes", {}).items():
-                for do_name, do_data in ln_data.get("data_objects", {}).items():
-                    for attr_name in do_data.get("attributes", []):
-                        ref = f"{ied_name}{ld_name}/{ln_name}.{do_name}.{attr_name}"
-                        references.append(ref)
+        if not self._read_pending:
+            self.log_message.emit("info", f"读取了 {self._read_count} 个数据点")
+    
+    def _apply_read_values(self, values: Dict):
+        """将读取结果更新到树形控件"""
+        update_data = {}
+        for ref, dv in values.items():
+            update_data[ref] = {
+                "value": dv.value,
+                "quality": dv.quality,
+                "timestamp": dv.timestamp.isoformat() if dv.timestamp else None
+            }
         
-        if references:
-            values = self.client.read_values(references)
-            
-            # 更新树形控件
-            update_data = {}
-            for ref, dv in values.items():
-                update_data[ref] = {
-                    "value": dv.value,
-                    "quality": dv.quality,
-                    "timestamp": dv.timestamp.isoformat() if dv.timestamp else None
-                }
-            
-            self.data_tree.update_values(update_data)
-            self.log_message.emit("info", f"读取了 {len(values)} 个数据点")
+        self.data_tree.update_values(update_data)
     
     def _read_value(self):
         """读取单个值"""
         ref = self.refInput.text().strip()
-        if not ref or not self.client:
+        if not ref or not self.client or not self._connected:
+            return
+        
+        self._read_value_requested.emit(self._generation, ref)
+    
+    def _on_value_read(self, generation: int, ref: str, dv):
+        """单个值读取结果"""
+        if generation != self._generation:
             return
         
-        dv = self.client.read_value(ref)
         if dv:
             if dv.error:
                 self.resultLabel.setText(f"错误: {dv.error}")
@@ -344,21 +621,16 @@ class ClientPanel(QWidget):
         ref = self.refInput.text().strip()
         value_str = self.valueInput.text().strip()
         
-        if not ref or not value_str or not self.client:
+        if not ref or not value_str or not self.client or not self._connected:
             return
         
-        # 转换值
-        try:
-            if value_str.lower() in ("true", "false"):
-                value = value_str.lower() == "true"
-            elif "." in value_str:
-                value = float(value_str)
-            else:
-                value = int(value_str)
-        except ValueError:
-            value = value_str
+        self._write_requested.emit(self._generation, ref, parse_value_text(value_str))
+    
+    def _on_write_done(self, generation: int, ref: str, value, success: bool):
+        """写入结果"""
+        if generation != self._generation:
+            return
         
-        success = self.client.write_value(ref, value)
         if success:
             self.resultLabel.setText(f"写入成功: {ref} = {value}")
             self.log_message.emit("info", f"写入成功: {ref} = {value}")
@@ -368,12 +640,8 @@ class ClientPanel(QWidget):
     
     def _on_value_changed(self, reference: str, value):
         """处理树形控件的值变化请求"""
-        if self.client and self.client.is_connected():
-            success = self.client.write_value(reference, value)
-            if success:
-                self.log_message.emit("info", f"已写入: {reference} = {value}")
-            else:
-                self.log_message.emit("error", f"写入失败: {reference}")
+        if self.client and self._connected:
+            self._write_requested.emit(self._generation, reference, value)
     
     def _on_item_selected(self, reference: str):
         """处理选中项变化"""
@@ -390,9 +658,12 @@ class ClientPanel(QWidget):
     def _subscribe(self):
         """订阅数据"""
         report_id = self.reportIdCombo.currentText()
-        if not report_id:
+        if not report_id or not self.client:
             return
         
+        # 数据变化经 on_data_change -> _on_data_changed 推送到界面。
+        # 后端 IPC 尚无报告通道，浏览结果中也没有数据集成员，
+        # 因此不以周期性批量读取代替报告，轮询保持关闭
         self.log_message.emit("info", f"订阅: {report_id}")
     
     def _unsubscribe(self):
@@ -400,7 +671,7 @@ class ClientPanel(QWidget):
         self.log_message.emit("info", "取消订阅")
     
     def _poll_data(self):
-        """轮询数据"""
+        """轮询数据（报告通道尚未提供，暂不轮询）"""
         pass
     
     # ========================================================================
@@ -408,18 +679,24 @@ class ClientPanel(QWidget):
     # ========================================================================
     
     def _on_client_state_changed(self, state: ClientState):
-        """客户端状态变化回调"""
-        state_text = {
-            ClientState.DISCONNECTED: ("未连接", "#6c757d"),
-            ClientState.CONNECTING: ("正在连接...", "#ffc107"),
-            ClientState.CONNECTED: ("已连接", "#28a745"),
-            ClientState.DISCONNECTING: ("正在断开...", "#ffc107"),
-            ClientState.ERROR: ("错误", "#dc3545"),
-        }
+        """客户端状态变化回调（连接断开或出错时同步停用依赖连接的控件）"""
+        if state == self._shown_state:
+            return
+        self._shown_state = state
+        
+        self._connected = state == ClientState.CONNECTED
+        self._set_connected_ui(self._connected)
+        if state in self.TRANSITION_STATES:
+            self.connectBtn.setEnabled(False)
+            self._disable_conn_inputs(True)
         
-        text, color = state_text.get(state, ("未知", "#6c757d"))
-        self.statusLabel.setText(f"状态: {text}")
-        self.statusLabel.setStyleSheet(f"color: {color}; font-size: 11px;")
+        text, _ = self.STATE_TEXT.get(state, ("未知", "#6c757d"))
+        label = self.statusLabel
+        label.setText(f"状态: {text}")
+        label.setProperty("state", state.name)
+        style = label.style()
+        style.unpolish(label)
+        style.polish(label)
     
     def _on_data_changed(self, reference: str, value):
         """数据变化回调"""
@@ -8,11 +8,15 @@ IEC61850数据模型树形显示控件
 
 from __future__ import annotations
 
+import sys
+import time
+from collections import deque
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker
 from PyQt6.QtGui import QFont, QColor, QBrush
 from PyQt6.QtWidgets import (
     QWidget, QTreeWidgetItem, QMenu, QHeaderView, QApplication, QInputDialog
@@ -22,8 +26,86 @@ from PyQt6 import uic
 # UI文件路径
 UI_DIR = Path(__file__).parent / "ui"
 
+# UI文件在导入时编译一次，每次实例化只调用生成的 setupUi
+_DataTreeForm, _ = uic.loadUiType(UI_DIR / "data_tree_widget.ui")
 
-class DataTreeWidget(QWidget):
+
+# 质量有效性（低两位，互斥取值）与详细位，与 core.data_model.Quality 一致
+_QUALITY_VALIDITY = {0x01: "Invalid", 0x02: "Reserved", 0x03: "Questionable"}
+_QUALITY_FLAGS = (
+    ("Overflow", 0x0004),
+    ("OutOfRange", 0x0008),
+    ("BadReference", 0x0010),
+    ("Oscillatory", 0x0020),
+    ("Failure", 0x0040),
+    ("OldData", 0x0080),
+    ("Inconsistent", 0x0100),
+    ("Inaccurate", 0x0200),
+    ("Substituted", 0x0400),
+    ("Test", 0x0800),
+    ("OperatorBlocked", 0x1000),
+)
+
+
+def parse_value_text(text: str) -> Any:
+    """把用户输入的文本转换为写入值: bool -> int -> float -> str"""
+    lowered = text.lower()
+    if lowered == "true":
+        return True
+    if lowered == "false":
+        return False
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+@lru_cache(maxsize=512)
+def _fmt_quality(quality: int) -> str:
+    """格式化质量标志（结果缓存，质量值组合有限）"""
+    if quality == 0:
+        return "Good"
+    
+    flags = [name for name, mask in _QUALITY_FLAGS if quality & mask]
+    validity = _QUALITY_VALIDITY.get(quality & 0x03)
+    if validity:
+        flags.insert(0, validity)
+    
+    return ", ".join(flags) if flags else "Unknown"
+
+
+@lru_cache(maxsize=4096)
+def _fmt_ts_str(timestamp: str) -> str:
+    """格式化ISO时间戳字符串（结果缓存，时间戳在各数据点间大量重复）"""
+    try:
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except Exception:
+        return timestamp
+
+
+class _DaInfo:
+    """数据属性节点的静态信息，可变的值/质量/时间戳存放在控件的并行数组中（按 row 索引）"""
+    
+    __slots__ = ("type", "name", "reference", "data_type", "row")
+    
+    def __init__(self, name: str, reference: str, data_type: str, row: int):
+        self.type = "da"
+        self.name = name
+        self.reference = reference
+        self.data_type = data_type
+        self.row = row
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """与节点字典相同的读取方式"""
+        return getattr(self, key, default)
+
+
+class DataTreeWidget(QWidget, _DataTreeForm):
     """
     数据模型树形显示控件
     
@@ -41,14 +123,63 @@ class DataTreeWidget(QWidget):
     value_changed = pyqtSignal(str, object)
     refresh_requested = pyqtSignal()
     
+    # 待构建子节点的构建函数存放角色（延迟加载）
+    PENDING_ROLE = Qt.ItemDataRole.UserRole + 1
+    
+    # 节点样式（隐式共享，所有节点复用同一实例）
+    _IED_FONT = QFont("Microsoft YaHei", 10, QFont.Weight.Bold)
+    _LD_FONT = QFont("Microsoft YaHei", 9, QFont.Weight.Bold)
+    _LD_BRUSH = QBrush(QColor("#0066cc"))
+    _LN_BRUSH = QBrush(QColor("#006600"))
+    _DO_BRUSH = QBrush(QColor("#996600"))
+    _BAD_Q_BRUSH = QBrush(QColor("#cc0000"))
+    _HL_BRUSH = QBrush(QColor("#ffffcc"))
+    _EMPTY_BRUSH = QBrush()
+    
+    # 值更新高亮持续时间（秒）与检查间隔（毫秒）
+    HIGHLIGHT_DURATION = 1.0
+    HIGHLIGHT_INTERVAL_MS = 100
+    
+    # 搜索输入防抖间隔（毫秒）
+    SEARCH_DELAY_MS = 150
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
         self._data_items: Dict[str, QTreeWidgetItem] = {}
         self._expand_level = 2
-        
-        # 加载UI文件
-        uic.loadUi(UI_DIR / "data_tree_widget.ui", self)
+        self._attr_wrap: Optional[Callable[[str], Dict]] = None
+        
+        # 延迟加载：LN以下的子节点在展开时才创建
+        self._leaf_refs: Dict[str, None] = {}  # 全部叶子引用（含未创建节点）
+        self._leaf_sources: List[tuple] = []  # 尚未登记叶子引用的 (LN引用, 数据对象字典)
+        self._pending_items: List[QTreeWidgetItem] = []  # 挂有占位子项的节点
+        self._pending_values: Dict[str, tuple] = {}  # 未创建节点收到的值
+        
+        # 搜索索引：[节点, 小写的"名称\n值"]，首次搜索时才遍历整棵树建立；
+        # 叶子条目按引用登记以便更新值
+        self._search_index: Optional[List[list]] = None
+        self._search_entries: Dict[str, list] = {}
+        
+        # 增量搜索：上次的关键字、匹配条目与仅因子项匹配而显示的祖先节点；
+        # 新关键字是上次关键字的延长时只需在上次的匹配条目中继续筛选
+        self._search_needle = ""
+        self._search_matches: Optional[List[list]] = None
+        self._search_revealed: List[QTreeWidgetItem] = []
+        
+        # 数据属性的可变字段（以 _DaInfo.row 为下标）
+        self._values: List[Any] = []
+        self._qualities: List[int] = []
+        self._timestamps: List[Optional[str]] = []
+        
+        # 值更新高亮：(到期时间, 节点列表) 队列，由单个定时器统一取消
+        self._highlight_queue: deque = deque()
+        self._highlight_timer = QTimer(self)
+        self._highlight_timer.setInterval(self.HIGHLIGHT_INTERVAL_MS)
+        self._highlight_timer.timeout.connect(self._drain_highlights)
+        
+        # 构建UI
+        self.setupUi(self)
         
         self._init_ui()
         self._connect_signals()
@@ -65,7 +196,11 @@ class DataTreeWidget(QWidget):
     
     def _connect_signals(self):
         """连接信号"""
-        self.searchInput.textChanged.connect(self._on_search)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._run_search)
+        self.searchInput.textChanged.connect(self._search_timer.start)
         self.expandBtn.clicked.connect(self._expand_all)
         self.collapseBtn.clicked.connect(self._collapse_all)
         self.refreshBtn.clicked.connect(self.refresh_requested.emit)
@@ -73,42 +208,76 @@ class DataTreeWidget(QWidget):
         self.tree.customContextMenuRequested.connect(self._show_context_menu)
         self.tree.itemSelectionChanged.connect(self._on_selection_changed)
         self.tree.itemDoubleClicked.connect(self._on_double_click)
+        self.tree.itemExpanded.connect(self._materialize_children)
     
-    def load_ied(self, ied_data: Dict):
+    def load_ied(self, ied_data: Dict,
+                 attr_wrap: Optional[Callable[[str], Dict]] = None):
         """
         加载IED数据模型
         
         Args:
             ied_data: IED数据字典
+            attr_wrap: 可选的属性适配函数。提供时，数据对象的 attributes
+                为属性名列表（如客户端浏览结果），逐个包装为属性字典，
+                无需预先构建完整的镜像字典
         """
-        self.tree.clear()
-        self._data_items.clear()
-        
-        if not ied_data:
-            return
-        
-        # 创建IED根节点
-        ied_name = ied_data.get("name", "IED")
-        ied_item = QTreeWidgetItem([ied_name, "", "IED", "", ""])
-        ied_item.setData(0, Qt.ItemDataRole.UserRole, {"type": "ied", "name": ied_name})
-        ied_item.setFont(0, QFont("Microsoft YaHei", 10, QFont.Weight.Bold))
-        self.tree.addTopLevelItem(ied_item)
-        
-        # 加载逻辑设备
-        for ld_name, ld_data in ied_data.get("logical_devices", {}).items():
-            self._add_logical_device(ied_item, ied_name, ld_name, ld_data)
+        # 批量加载期间暂停重绘、排序与树控件信号
+        tree = self.tree
+        prev_sort = tree.isSortingEnabled()
+        tree.setUpdatesEnabled(False)
+        tree.setSortingEnabled(False)
+        tree.blockSignals(True)
+        try:
+            self.clear()
+            
+            self._attr_wrap = attr_wrap
+            
+            if not ied_data:
+                return
+            
+            # 创建IED根节点，整棵子树在树控件外构建完成后一次挂载
+            ied_name = ied_data.get("name", ied_data.get("ied_name", "IED"))
+            ied_item = QTreeWidgetItem([ied_name, "", "IED"])
+            ied_item.setData(0, Qt.ItemDataRole.UserRole, {"type": "ied", "name": ied_name})
+            ied_item.setFont(0, self._IED_FONT)
+            
+            # 加载逻辑设备（父节点尚未挂载，直接以父节点构造子节点）
+            for ld_name, ld_data in ied_data.get("logical_devices", {}).items():
+                self._add_logical_device(ied_item, ied_name, ld_name, ld_data)
+            tree.addTopLevelItem(ied_item)
+        finally:
+            tree.blockSignals(False)
+            tree.setSortingEnabled(prev_sort)
+            tree.setUpdatesEnabled(True)
         
         # 展开到指定层级
         self._expand_to_level(self._expand_level)
         
-        # 更新状态
-        count = len(self._data_items)
-        self.statusLabel.setText(f"共 {count} 个数据点")
+        # 叶子引用在首次需要时才登记，数据点统计放到事件循环空闲时进行，
+        # 加载本身只与LD/LN数量相关
+        QTimer.singleShot(0, self._show_point_count)
+    
+    def clear(self):
+        """清空数据树"""
+        self.tree.clear()
+        self._data_items.clear()
+        self._leaf_refs.clear()
+        self._leaf_sources.clear()
+        self._pending_items.clear()
+        self._pending_values.clear()
+        self._search_index = None
+        self._reset_search_state()
+        self._search_entries.clear()
+        self._values.clear()
+        self._qualities.clear()
+        self._timestamps.clear()
+        self._highlight_queue.clear()
+        self._highlight_timer.stop()
     
-    def _add_logical_device(self, parent: QTreeWidgetItem, ied_name: str, 
-                            ld_name: str, ld_data: Dict):
-        """添加逻辑设备节点"""
-        ld_item = QTreeWidgetItem([
+    def _add_logical_device(self, parent: QTreeWidgetItem, ied_name: str,
+                            ld_name: str, ld_data: Dict) -> QTreeWidgetItem:
+        """在未挂载的父节点下创建逻辑设备节点（含逻辑节点子树）"""
+        ld_item = QTreeWidgetItem(parent, [
             ld_name,
             "",
             "LD",
@@ -119,19 +288,19 @@ class DataTreeWidget(QWidget):
             "name": ld_name,
             "reference": f"{ied_name}{ld_name}"
         })
-        ld_item.setFont(0, QFont("Microsoft YaHei", 9, QFont.Weight.Bold))
-        ld_item.setForeground(0, QBrush(QColor("#0066cc")))
-        parent.addChild(ld_item)
+        ld_item.setFont(0, self._LD_FONT)
+        ld_item.setForeground(0, self._LD_BRUSH)
         
         # 加载逻辑节点
         for ln_name, ln_data in ld_data.get("logical_nodes", {}).items():
             self._add_logical_node(ld_item, ied_name, ld_name, ln_name, ln_data)
+        return ld_item
     
-    def _add_logical_node(self, parent: QTreeWidgetItem, ied_name: str,
-                          ld_name: str, ln_name: str, ln_data: Dict):
-        """添加逻辑节点"""
+    def _add_logical_node(self, parent: QTreeWidgetItem, ied_name: str, ld_name: str,
+                          ln_name: str, ln_data: Dict) -> QTreeWidgetItem:
+        """在未挂载的父节点下创建逻辑节点"""
         ln_class = ln_data.get("class", "")
-        ln_item = QTreeWidgetItem([
+        ln_item = QTreeWidgetItem(parent, [
             f"{ln_name} [{ln_class}]",
             "",
             "LN",
@@ -144,16 +313,25 @@ class DataTreeWidget(QWidget):
             "class": ln_class,
             "reference": ln_ref
         })
-        ln_item.setForeground(0, QBrush(QColor("#006600")))
-        parent.addChild(ln_item)
-        
-        # 加载数据对象
-        for do_name, do_data in ln_data.get("data_objects", {}).items():
-            self._add_data_object(ln_item, ln_ref, do_name, do_data)
+        ln_item.setForeground(0, self._LN_BRUSH)
+        
+        # 数据对象延迟到展开时创建，叶子引用延迟到首次需要时登记
+        data_objects = ln_data.get("data_objects", {})
+        if data_objects:
+            self._leaf_sources.append((ln_ref, data_objects))
+            self._defer_children(ln_item, partial(self._add_data_objects, ln_item, ln_ref, data_objects))
+        return ln_item
+    
+    def _add_data_objects(self, parent: QTreeWidgetItem, ln_ref: str, data_objects: Dict):
+        """创建逻辑节点下的全部数据对象"""
+        parent.addChildren([
+            self._add_data_object(ln_ref, do_name, do_data)
+            for do_name, do_data in data_objects.items()
+        ])
     
-    def _add_data_object(self, parent: QTreeWidgetItem, ln_ref: str,
-                         do_name: str, do_data: Dict):
-        """添加数据对象"""
+    def _add_data_object(self, ln_ref: str, do_name: str,
+                         do_data: Dict) -> QTreeWidgetItem:
+        """创建数据对象"""
         cdc = do_data.get("cdc", "")
         do_item = QTreeWidgetItem([
             f"{do_name} ({cdc})",
@@ -168,17 +346,33 @@ class DataTreeWidget(QWidget):
             "cdc": cdc,
             "reference": do_ref
         })
-        do_item.setForeground(0, QBrush(QColor("#996600")))
-        parent.addChild(do_item)
+        do_item.setForeground(0, self._DO_BRUSH)
         
-        # 加载数据属性
-        for da_name, da_data in do_data.get("attributes", {}).items():
-            self._add_data_attribute(do_item, do_ref, da_name, da_data)
+        # 数据属性延迟到展开时创建
+        attributes = do_data.get("attributes", {})
+        if attributes:
+            self._defer_children(do_item, partial(self._add_data_attributes, do_item, do_ref, attributes))
+        return do_item
     
-    def _add_data_attribute(self, parent: QTreeWidgetItem, do_ref: str,
-                            da_name: str, da_data: Dict):
-        """添加数据属性"""
-        da_ref = f"{do_ref}.{da_name}"
+    def _add_data_attributes(self, parent: QTreeWidgetItem, do_ref: str, attributes):
+        """创建数据对象（或结构属性）下的全部数据属性"""
+        if self._attr_wrap:
+            wrap = self._attr_wrap
+            children = [
+                self._add_data_attribute(do_ref, da_name, wrap(da_name))
+                for da_name in attributes
+            ]
+        else:
+            children = [
+                self._add_data_attribute(do_ref, da_name, da_data)
+                for da_name, da_data in attributes.items()
+            ]
+        parent.addChildren(children)
+    
+    def _add_data_attribute(self, do_ref: str, da_name: str,
+                            da_data: Dict) -> QTreeWidgetItem:
+        """创建数据属性（含子属性）"""
+        da_ref = sys.intern(f"{do_ref}.{da_name}")
         
         value = da_data.get("value", "")
         da_type = da_data.get("type", "")
@@ -196,27 +390,120 @@ class DataTreeWidget(QWidget):
             da_type,
             description
         ])
-        da_item.setData(0, Qt.ItemDataRole.UserRole, {
-            "type": "da",
-            "name": da_name,
-            "reference": da_ref,
-            "data_type": da_type,
-            "value": value
-        })
+        da_item.setData(0, Qt.ItemDataRole.UserRole,
+                        _DaInfo(da_name, da_ref, da_type, len(self._values)))
+        self._values.append(value)
+        self._qualities.append(quality)
+        self._timestamps.append(None)
         
         # 根据质量设置颜色
         if quality != 0:
-            da_item.setForeground(1, QBrush(QColor("#cc0000")))
-        
-        parent.addChild(da_item)
+            da_item.setForeground(1, self._BAD_Q_BRUSH)
 
-        # 加载子属性（如果有）
-        for sub_da_name, sub_da_data in da_data.get("attributes", {}).items():
-            self._add_data_attribute(da_item, do_ref, sub_da_name, sub_da_data)
-
-        # 没有子属性才加入数据项字典
-        if da_data.get("attributes", {}) == {}:
+        # 子属性（如果有）延迟到展开时创建
+        sub_attributes = da_data.get("attributes", {})
+        if sub_attributes:
+            self._defer_children(da_item, partial(self._add_data_attributes, da_item, do_ref, sub_attributes))
+        else:
+            # 没有子属性才加入数据项字典
             self._data_items[da_ref] = da_item
+            
+            # 节点创建前收到的值
+            pending = self._pending_values.pop(da_ref, None)
+            if pending:
+                self._apply_value(da_item, *pending)
+        
+        return da_item
+    
+    def _build_search_index(self) -> List[list]:
+        """遍历整棵树建立搜索索引，名称与值列只在建立和值变化时转为小写"""
+        index = []
+        entries = self._search_entries
+        tree = self.tree
+        stack = [tree.topLevelItem(i) for i in range(tree.topLevelItemCount())]
+        while stack:
+            item = stack.pop()
+            entry = [item, f"{item.text(0)}\n{item.text(1)}".lower()]
+            index.append(entry)
+            info = item.data(0, Qt.ItemDataRole.UserRole)
+            if isinstance(info, _DaInfo):
+                entries[info.reference] = entry
+            stack.extend(item.child(i) for i in range(item.childCount()))
+        self._search_index = index
+        return index
+    
+    def _ensure_leaf_refs(self) -> Dict[str, None]:
+        """登记尚未处理的逻辑节点的叶子引用，返回全部叶子引用"""
+        if self._leaf_sources:
+            sources, self._leaf_sources = self._leaf_sources, []
+            for ln_ref, data_objects in sources:
+                self._collect_leaf_refs(ln_ref, data_objects)
+        return self._leaf_refs
+    
+    def _show_point_count(self):
+        """显示数据点总数"""
+        self.statusLabel.setText(f"共 {len(self._ensure_leaf_refs())} 个数据点")
+    
+    def _collect_leaf_refs(self, ln_ref: str, data_objects: Dict):
+        """
+        登记逻辑节点下全部叶子属性的引用（与 _add_data_attribute 的引用规则一致）
+        
+        直接遍历输入字典，用显式栈代替递归，不创建任何树节点；
+        引用经 sys.intern 驻留，更新时的字典查找可走字符串同一性快速路径
+        """
+        leaf_refs = self._leaf_refs
+        wrap = self._attr_wrap
+        intern = sys.intern
+        for do_name, do_data in data_objects.items():
+            do_ref = f"{ln_ref}.{do_name}"
+            attributes = do_data.get("attributes", {})
+            if wrap:
+                for da_name in attributes:
+                    leaf_refs[intern(f"{do_ref}.{da_name}")] = None
+                continue
+            
+            stack = [iter(attributes.items())]
+            while stack:
+                for da_name, da_data in stack[-1]:
+                    sub_attributes = da_data.get("attributes")
+                    if sub_attributes:
+                        stack.append(iter(sub_attributes.items()))
+                        break
+                    leaf_refs[intern(f"{do_ref}.{da_name}")] = None
+                else:
+                    stack.pop()
+    
+    # ========================================================================
+    # 延迟加载
+    # ========================================================================
+    
+    def _defer_children(self, item: QTreeWidgetItem, builder: Callable[[], None]):
+        """挂载占位子项，节点首次展开时再调用 builder 创建真实子节点"""
+        QTreeWidgetItem(item, ["..."])
+        item.setData(0, self.PENDING_ROLE, builder)
+        self._pending_items.append(item)
+    
+    def _materialize_children(self, item: QTreeWidgetItem):
+        """创建节点的真实子节点（itemExpanded 时触发）"""
+        builder = item.data(0, self.PENDING_ROLE)
+        if builder is None:
+            return
+        
+        item.setData(0, self.PENDING_ROLE, None)
+        item.takeChildren()
+        builder()
+    
+    def _materialize_all(self):
+        """创建全部延迟节点（全部展开、搜索时需要完整的树）"""
+        if not self._pending_items:
+            return
+        
+        self.tree.setUpdatesEnabled(False)
+        try:
+            while self._pending_items:
+                self._materialize_children(self._pending_items.pop())
+        finally:
+            self.tree.setUpdatesEnabled(True)
     
     def update_value(self, reference: str, value: Any, quality: int = 0, 
                      timestamp: Optional[str] = None):
@@ -229,34 +516,108 @@ class DataTreeWidget(QWidget):
             quality: 质量标志
             timestamp: 时间戳
         """
+        item = self._update_value_fast(reference, value, quality, timestamp)
+        if item is not None:
+            self._highlight([item])
+    
+    def _update_value_fast(self, reference: str, value: Any, quality: int = 0,
+                           timestamp: Optional[str] = None) -> Optional[QTreeWidgetItem]:
+        """写入值但不高亮，返回已创建的数据项"""
         item = self._data_items.get(reference)
-        if item:
-            item.setText(1, self._format_value(value))
-            item.setText(3, self._format_quality(quality))
+        if item is not None:
+            self._apply_value(item, value, quality, timestamp)
+        elif reference in self._ensure_leaf_refs():
+            # 节点尚未创建，暂存到展开时再显示
+            self._pending_values[reference] = (value, quality, timestamp)
+        return item
+    
+    def _highlight(self, items: List[QTreeWidgetItem]):
+        """高亮显示更新的数据项，到期后由 _drain_highlights 一并取消"""
+        brush = self._HL_BRUSH
+        for item in items:
+            item.setBackground(1, brush)
+        self._highlight_queue.append((time.monotonic() + self.HIGHLIGHT_DURATION, items))
+        if not self._highlight_timer.isActive():
+            self._highlight_timer.start()
+    
+    def _drain_highlights(self):
+        """取消已到期的高亮"""
+        now = time.monotonic()
+        queue = self._highlight_queue
+        empty = self._EMPTY_BRUSH
+        while queue and queue[0][0] <= now:
+            for item in queue.popleft()[1]:
+                item.setBackground(1, empty)
+        if not queue:
+            self._highlight_timer.stop()
+    
+    def _apply_value(self, item: QTreeWidgetItem, value: Any, quality: int = 0,
+                     timestamp: Optional[str] = None):
+        """将值写入数据项，文本未变化的列不重复设置"""
+        value_str = self._format_value(value)
+        value_changed = item.text(1) != value_str
+        if value_changed:
+            item.setText(1, value_str)
+        quality_str = self._format_quality(quality)
+        if item.text(3) != quality_str:
+            item.setText(3, quality_str)
+        if timestamp:
+            time_str = self._format_timestamp(timestamp)
+            if item.text(4) != time_str:
+                item.setText(4, time_str)
+        
+        # 更新存储的值（直接写入并行数组，无需 setData）
+        info = item.data(0, Qt.ItemDataRole.UserRole)
+        if isinstance(info, _DaInfo):
+            row = info.row
+            self._values[row] = value
+            self._qualities[row] = quality
             if timestamp:
-                item.setText(4, self._format_timestamp(timestamp))
-            
-            # 高亮显示更新
-            item.setBackground(1, QBrush(QColor("#ffffcc")))
-            
-            # 1秒后取消高亮
-            QTimer.singleShot(1000, lambda: item.setBackground(1, QBrush()))
+                self._timestamps[row] = timestamp
             
-            # 更新存储的值
-            data = item.data(0, Qt.ItemDataRole.UserRole)
-            if data:
-                data["value"] = value
-                item.setData(0, Qt.ItemDataRole.UserRole, data)
+            # 同步搜索索引
+            if value_changed:
+                entry = self._search_entries.get(info.reference)
+                if entry:
+                    entry[1] = f"{item.text(0)}\n{value_str}".lower()
+                    self._search_matches = None
     
     def update_values(self, values: Dict[str, Dict]):
-        """批量更新值"""
-        for ref, value_info in values.items():
-            self.update_value(
-                ref,
-                value_info.get("value"),
-                value_info.get("quality", 0),
-                value_info.get("timestamp")
-            )
+        """批量更新值（整批只重绘一次、只登记一次高亮、只写一次状态栏）"""
+        if not values:
+            return
+        
+        touched = []
+        self.tree.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.tree)
+        try:
+            intern = sys.intern
+            update = self._update_value_fast
+            for ref, value_info in values.items():
+                item = update(
+                    intern(ref),
+                    value_info.get("value"),
+                    value_info.get("quality", 0),
+                    value_info.get("timestamp")
+                )
+                if item is not None:
+                    touched.append(item)
+            if touched:
+                self._highlight(touched)
+        finally:
+            blocker.unblock()
+            self.tree.setUpdatesEnabled(True)
+        
+        # 批量期间屏蔽了树控件信号，选中项被更新时补发一次选择通知
+        selected = self.get_selected_reference()
+        if selected and selected in values:
+            self._on_selection_changed()
+        
+        self.statusLabel.setText(f"共 {len(self._ensure_leaf_refs())} 个数据点，已更新 {len(values)} 点")
+    
+    def get_references(self) -> List[str]:
+        """获取所有叶子数据属性的引用"""
+        return list(self._ensure_leaf_refs())
     
     def get_selected_reference(self) -> Optional[str]:
         """获取当前选中项的引用"""
@@ -271,9 +632,25 @@ class DataTreeWidget(QWidget):
         """获取当前选中项的数据"""
         items = self.tree.selectedItems()
         if items:
-            return items[0].data(0, Qt.ItemDataRole.UserRole)
+            return self._item_data(items[0])
         return None
     
+    def _item_data(self, item: QTreeWidgetItem) -> Optional[Dict]:
+        """节点数据字典，数据属性节点合并并行数组中的当前值"""
+        data = item.data(0, Qt.ItemDataRole.UserRole)
+        if not isinstance(data, _DaInfo):
+            return data
+        row = data.row
+        return {
+            "type": data.type,
+            "name": data.name,
+            "reference": data.reference,
+            "data_type": data.data_type,
+            "value": self._values[row],
+            "quality": self._qualities[row],
+            "timestamp": self._timestamps[row],
+        }
+    
     def _format_value(self, value: Any) -> str:
         """格式化值显示"""
         if value is None:
@@ -286,20 +663,7 @@ class DataTreeWidget(QWidget):
     
     def _format_quality(self, quality: int) -> str:
         """格式化质量标志"""
-        if quality == 0:
-            return "Good"
-        
-        flags = []
-        if quality & 0x01:
-            flags.append("Invalid")
-        if quality & 0x02:
-            flags.append("Reserved")
-        if quality & 0x03:
-            flags.append("Questionable")
-        if quality & 0x0800:
-            flags.append("Test")
-        
-        return ", ".join(flags) if flags else "Unknown"
+        return _fmt_quality(quality)
     
     def _format_timestamp(self, timestamp: Any) -> str:
         """格式化时间戳"""
@@ -308,38 +672,73 @@ class DataTreeWidget(QWidget):
         if isinstance(timestamp, datetime):
             return timestamp.strftime("%Y-%m-%d %H:%M:%S")
         if isinstance(timestamp, str):
-            try:
-                dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                return dt.strftime("%Y-%m-%d %H:%M:%S")
-            except Exception:
-                return timestamp
+            return _fmt_ts_str(timestamp)
         return str(timestamp)
     
+    def _run_search(self):
+        """输入停止后执行搜索"""
+        self._on_search(self.searchInput.text())
+    
+    def _reset_search_state(self):
+        """清除增量搜索状态"""
+        self._search_needle = ""
+        self._search_matches = None
+        self._search_revealed = []
+    
     def _on_search(self, text: str):
         """搜索过滤"""
-        text = text.lower()
-        
-        def filter_item(item: QTreeWidgetItem) -> bool:
-            """递归过滤"""
-            # 检查当前项
-            match = text in item.text(0).lower() or text in item.text(1).lower()
+        needle = text.lower()
+        index = self._search_index
+        if not needle and index is None:
+            # 尚未搜索过，没有隐藏的节点
+            return
+        if needle and index is None:
+            self._materialize_all()
+            index = self._build_search_index()
+        
+        self.tree.setUpdatesEnabled(False)
+        try:
+            if not needle:
+                for item, _ in index:
+                    item.setHidden(False)
+                self._reset_search_state()
+                return
+            
+            if (self._search_matches is not None and self._search_needle
+                    and needle.startswith(self._search_needle)):
+                # 关键字延长：不匹配上次关键字的节点已隐藏，只需复查上次的匹配条目
+                candidates = self._search_matches
+                for item in self._search_revealed:
+                    item.setHidden(True)
+            else:
+                candidates = index
             
-            # 检查子项
-            child_match = False
-            for i in range(item.childCount()):
-                if filter_item(item.child(i)):
-                    child_match = True
+            # 第一遍：按缓存的小写文本匹配
+            matched = []
+            for entry in candidates:
+                hit = needle in entry[1]
+                entry[0].setHidden(not hit)
+                if hit:
+                    matched.append(entry)
             
-            # 设置可见性
-            item.setHidden(not (match or child_match) and bool(text))
+            # 第二遍：显示匹配项的祖先节点（遇到已显示的祖先即可停止）
+            revealed = []
+            for entry in matched:
+                parent = entry[0].parent()
+                while parent is not None and parent.isHidden():
+                    parent.setHidden(False)
+                    revealed.append(parent)
+                    parent = parent.parent()
             
-            return match or child_match
-        
-        for i in range(self.tree.topLevelItemCount()):
-            filter_item(self.tree.topLevelItem(i))
+            self._search_needle = needle
+            self._search_matches = matched
+            self._search_revealed = revealed
+        finally:
+            self.tree.setUpdatesEnabled(True)
     
     def _expand_all(self):
         """全部展开"""
+        self._materialize_all()
         self.tree.expandAll()
     
     def _collapse_all(self):
@@ -347,17 +746,14 @@ class DataTreeWidget(QWidget):
         self.tree.collapseAll()
     
     def _expand_to_level(self, level: int):
-        """展开到指定层级"""
-        def expand_item(item: QTreeWidgetItem, current_level: int):
-            if current_level < level:
-                item.setExpanded(True)
-                for i in range(item.childCount()):
-                    expand_item(item.child(i), current_level + 1)
-            else:
-                item.setExpanded(False)
-        
-        for i in range(self.tree.topLevelItemCount()):
-            expand_item(self.tree.topLevelItem(i), 0)
+        """展开到指定层级（层级小于 level 的节点展开，其余折叠）"""
+        self.tree.setUpdatesEnabled(False)
+        try:
+            self.tree.collapseAll()
+            if level > 0:
+                self.tree.expandToDepth(level - 1)
+        finally:
+            self.tree.setUpdatesEnabled(True)
     
     def _on_selection_changed(self):
         """选择变化"""
@@ -377,7 +773,7 @@ class DataTreeWidget(QWidget):
         if not item:
             return
         
-        data = item.data(0, Qt.ItemDataRole.UserRole)
+        data = self._item_data(item)
         if not data:
             return
         
@@ -386,14 +782,14 @@ class DataTreeWidget(QWidget):
         # 复制引用
         copy_ref_action = menu.addAction("复制引用")
         copy_ref_action.triggered.connect(
-            lambda: self._copy_to_clipboard(data.get("reference", ""))
+            partial(self._copy_to_clipboard, data.get("reference", ""))
         )
         
         # 复制值
         if data.get("type") == "da":
             copy_value_action = menu.addAction("复制值")
             copy_value_action.triggered.connect(
-                lambda: self._copy_to_clipboard(str(data.get("value", "")))
+                partial(self._copy_to_clipboard, str(data.get("value", "")))
             )
             
             menu.addSeparator()
@@ -401,7 +797,7 @@ class DataTreeWidget(QWidget):
             # 修改值
             edit_action = menu.addAction("修改值...")
             edit_action.triggered.connect(
-                lambda: self._edit_value(data.get("reference", ""), data.get("value"))
+                partial(self._edit_value, data.get("reference", ""), data.get("value"))
             )
         
         menu.addSeparator()
@@ -410,13 +806,17 @@ class DataTreeWidget(QWidget):
         if item.childCount() > 0:
             if item.isExpanded():
                 collapse_action = menu.addAction("折叠")
-                collapse_action.triggered.connect(lambda: item.setExpanded(False))
+                collapse_action.triggered.connect(partial(self._set_item_expanded, item, False))
             else:
                 expand_action = menu.addAction("展开")
-                expand_action.triggered.connect(lambda: item.setExpanded(True))
+                expand_action.triggered.connect(partial(self._set_item_expanded, item, True))
         
         menu.exec(self.tree.mapToGlobal(pos))
     
+    def _set_item_expanded(self, item: QTreeWidgetItem, expanded: bool):
+        """展开/折叠节点"""
+        item.setExpanded(expanded)
+    
     def _copy_to_clipboard(self, text: str):
         """复制到剪贴板"""
         clipboard = QApplication.clipboard()
@@ -432,15 +832,4 @@ class DataTreeWidget(QWidget):
         )
         
         if ok:
-            # 尝试转换类型
-            try:
-                if new_value.lower() in ("true", "false"):
-                    new_value = new_value.lower() == "true"
-                elif "." in new_value:
-                    new_value = float(new_value)
-                else:
-                    new_value = int(new_value)
-            except ValueError:
-                pass  # 保持字符串
-            
-            self.value_changed.emit(reference, new_value)
+            self.value_changed.emit(reference, parse_value_text(new_value.strip()))
@@ -7,14 +7,19 @@ Instance List Widget
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QAbstractListModel, QModelIndex, QEvent, QPoint, QRect, QSize
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QHelpEvent, QPainter, QPalette
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout,
+    QWidget, QVBoxLayout, QHBoxLayout, QApplication, QAbstractItemView,
     QPushButton, QLabel, QDialog, QLineEdit, QSpinBox, QFormLayout,
-    QDialogButtonBox, QFrame, QToolButton, QSizePolicy, QFileDialog, QScrollArea
+    QDialogButtonBox, QFrame, QFileDialog, QListView, QStyle,
+    QStyledItemDelegate, QStyleOptionViewItem, QStyleOptionToolButton, QToolTip
 )
 
 class InstanceCreateDialog(QDialog):
@@ -96,153 +101,297 @@ class InstanceCreateDialog(QDialog):
         return config
 
 
-class InstanceItemWidget(QFrame):
-    """实例项显示组件"""
+@dataclass(slots=True)
+class InstanceRecord:
+    """实例列表中的一行"""
+    instance_id: str
+    name: str
+    state: str
+    details: str = ""
+    
+    def matches_filter(self, query: str) -> bool:
+        """检查是否匹配筛选条件"""
+        if not query:
+            return True
+        haystack = f"{self.name} {self.details} {self.state} {self.instance_id}".lower()
+        return query.lower() in haystack
+
+
+class InstanceListModel(QAbstractListModel):
+    """实例列表模型"""
+    
+    IdRole = Qt.ItemDataRole.UserRole + 1
+    NameRole = Qt.ItemDataRole.UserRole + 2
+    StateRole = Qt.ItemDataRole.UserRole + 3
+    DetailsRole = Qt.ItemDataRole.UserRole + 4
+    
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._records: List[InstanceRecord] = []
+        self._rows: Dict[str, int] = {}  # instance_id -> 行号
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        record = self._records[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, self.NameRole):
+            return record.name
+        if role == self.IdRole:
+            return record.instance_id
+        if role == self.StateRole:
+            return record.state
+        if role == self.DetailsRole:
+            return record.details
+        return None
+    
+    def record(self, row: int) -> InstanceRecord:
+        """获取指定行的记录"""
+        return self._records[row]
+    
+    def records(self) -> List[InstanceRecord]:
+        """全部记录"""
+        return self._records
+    
+    def row_of(self, instance_id: Optional[str]) -> int:
+        """实例所在行，不存在时返回 -1"""
+        return self._rows.get(instance_id, -1)
+    
+    def add_record(self, record: InstanceRecord) -> int:
+        """追加记录，返回行号"""
+        row = len(self._records)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._records.append(record)
+        self._rows[record.instance_id] = row
+        self.endInsertRows()
+        return row
+    
+    def remove_record(self, instance_id: str) -> bool:
+        """移除记录"""
+        row = self._rows.get(instance_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._records[row]
+        del self._rows[instance_id]
+        for i in range(row, len(self._records)):
+            self._rows[self._records[i].instance_id] = i
+        self.endRemoveRows()
+        return True
+    
+    def clear_records(self):
+        """移除全部记录（一次重置模型，不逐行通知视图）"""
+        self.beginResetModel()
+        self._records.clear()
+        self._rows.clear()
+        self.endResetModel()
+    
+    def set_field(self, instance_id: str, field_name: str, value: str, role: int):
+        """修改记录字段并通知视图"""
+        row = self._rows.get(instance_id)
+        if row is None:
+            return
+        record = self._records[row]
+        if getattr(record, field_name) == value:
+            return
+        setattr(record, field_name, value)
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [role])
+
+
+class InstanceItemDelegate(QStyledItemDelegate):
+    """
+    实例项绘制代理
+    
+    所有行共用一个代理：绘制状态指示器、名称、详情、状态文本，
+    以及启动/停止、配置、移除三个按钮，按钮点击在 editorEvent 中处理。
+    """
     
     # 信号
     start_clicked = pyqtSignal(str)  # instance_id
     stop_clicked = pyqtSignal(str)  # instance_id
     config_clicked = pyqtSignal(str)  # instance_id
     remove_clicked = pyqtSignal(str)  # instance_id
-    selected = pyqtSignal(str)  # instance_id
     
-    # 状态颜色映射
+    # 状态颜色映射（颜色在类定义时解析一次）
     STATE_COLORS = {
-        "STOPPED": "#888888",
-        "STARTING": "#FFA500",
-        "RUNNING": "#00AA00",
-        "STOPPING": "#FFA500",
-        "ERROR": "#FF0000",
-        "DISCONNECTED": "#888888",
-        "CONNECTING": "#FFA500",
-        "CONNECTED": "#00AA00",
-        "DISCONNECTING": "#FFA500",
+        "STOPPED": QColor("#888888"),
+        "STARTING": QColor("#FFA500"),
+        "RUNNING": QColor("#00AA00"),
+        "STOPPING": QColor("#FFA500"),
+        "ERROR": QColor("#FF0000"),
+        "DISCONNECTED": QColor("#888888"),
+        "CONNECTING": QColor("#FFA500"),
+        "CONNECTED": QColor("#00AA00"),
+        "DISCONNECTING": QColor("#FFA500"),
     }
+    DEFAULT_STATE_COLOR = QColor("#888888")
+    RUNNING_STATES = ("RUNNING", "CONNECTED")
+    STOPPED_STATES = ("STOPPED", "DISCONNECTED", "ERROR")
     
-    def __init__(
-        self,
-        instance_id: str,
-        name: str,
-        state: str,
-        details: str = "",
-        parent: Optional[QWidget] = None
-    ):
+    # 选中项背景与边框颜色
+    SELECTED_COLOR = QColor("#e0e8f0")
+    BORDER_COLOR = QColor("#c8c8c8")
+    DETAILS_COLOR = QColor("#666666")
+    
+    ROW_HEIGHT = 44
+    BUTTON_SIZE = 24
+    MARGIN = 8
+    SPACING = 8
+    
+    def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
-        self.instance_id = instance_id
-        self._name = name
-        self._details = details
-        self._state = state
-        
-        self._init_ui(name, state, details)
-        self._update_style(state)
+        self._base_font: Optional[QFont] = None
+        self._fonts: tuple = ()
     
-    def _init_ui(self, name: str, state: str, details: str):
-        self.setFrameStyle(QFrame.Shape.StyledPanel | QFrame.Shadow.Raised)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
+    def _fonts_for(self, base: QFont) -> tuple:
+        """由视图字体派生的小号字体、粗体及其度量，视图字体不变时复用"""
+        if base != self._base_font:
+            small_font = QFont(base)
+            small_font.setPixelSize(11)
+            bold_font = QFont(base)
+            bold_font.setBold(True)
+            self._base_font = QFont(base)
+            self._fonts = (small_font, bold_font, QFontMetrics(small_font), QFontMetrics(bold_font))
+        return self._fonts
+    
+    def _button_rects(self, rect: QRect) -> Dict[str, QRect]:
+        """按钮区域（从右向左：移除、配置、启动/停止）"""
+        size = self.BUTTON_SIZE
+        top = rect.top() + (rect.height() - size) // 2
+        right = rect.right() - self.MARGIN
+        rects = {}
+        for name in ("remove", "config", "toggle"):
+            rects[name] = QRect(right - size + 1, top, size, size)
+            right -= size + 2
+        return rects
+    
+    def _button_states(self, state: str) -> Dict[str, tuple]:
+        """按钮文本、提示与可用性"""
+        if state in self.RUNNING_STATES:
+            toggle = ("⏹", "停止", True)
+        elif state in self.STOPPED_STATES:
+            toggle = ("▶", "启动", True)
+        else:
+            toggle = ("…", "状态切换中", False)
+        return {
+            "toggle": toggle,
+            "config": ("⚙", "配置", True),
+            "remove": ("✕", "移除", state in self.STOPPED_STATES),
+        }
+    
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+    
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        model = index.model()
+        state = index.data(InstanceListModel.StateRole)
+        rect = option.rect
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
         
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(8, 4, 8, 4)
-        layout.setSpacing(8)
+        painter.save()
         
-        # 状态指示器
-        self.status_indicator = QLabel("●")
-        self.status_indicator.setFixedWidth(20)
-        layout.addWidget(self.status_indicator)
+        # 背景与边框
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(rect, self.SELECTED_COLOR)
+        painter.setPen(self.BORDER_COLOR)
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
         
-        # 信息区域
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(2)
+        buttons = self._button_rects(rect)
+        left = rect.left() + self.MARGIN
         
-        # 名称
-        self.name_label = QLabel(name)
-        self.name_label.setStyleSheet("font-weight: bold;")
-        info_layout.addWidget(self.name_label)
+        # 状态指示器
+        painter.setPen(self.STATE_COLORS.get(state, self.DEFAULT_STATE_COLOR))
+        painter.drawText(QRect(left, rect.top(), 20, rect.height()),
+                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft, "●")
+        left += 20 + self.SPACING
         
-        # 详情
-        self.details_label = QLabel(details)
-        self.details_label.setStyleSheet("color: #666; font-size: 11px;")
-        info_layout.addWidget(self.details_label)
+        # 状态文本
+        small_font, bold_font, small_metrics, bold_metrics = self._fonts_for(option.font)
+        painter.setFont(small_font)
+        state_width = small_metrics.horizontalAdvance(state)
+        state_right = buttons["toggle"].left() - self.SPACING
+        painter.setPen(option.palette.color(QPalette.ColorRole.Text))
+        painter.drawText(QRect(state_right - state_width, rect.top(), state_width, rect.height()),
+                         Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight, state)
         
-        info_widget = QWidget()
-        info_widget.setLayout(info_layout)
-        info_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        layout.addWidget(info_widget)
+        # 名称与详情
+        text_width = max(0, state_right - state_width - self.SPACING - left)
+        half = rect.height() // 2
+        painter.setFont(bold_font)
+        name = bold_metrics.elidedText(
+            index.data(InstanceListModel.NameRole), Qt.TextElideMode.ElideRight, text_width)
+        painter.drawText(QRect(left, rect.top() + 2, text_width, half - 2),
+                         Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignLeft, name)
+        painter.setFont(small_font)
+        painter.setPen(self.DETAILS_COLOR)
+        details = small_metrics.elidedText(
+            index.data(InstanceListModel.DetailsRole), Qt.TextElideMode.ElideRight, text_width)
+        painter.drawText(QRect(left, rect.top() + half, text_width, half - 2),
+                         Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft, details)
         
-        # 状态标签
-        self.state_label = QLabel(state)
-        self.state_label.setStyleSheet("font-size: 11px;")
-        layout.addWidget(self.state_label)
+        # 按钮
+        painter.setFont(option.font)
+        for name, (text, _, enabled) in self._button_states(state).items():
+            button = QStyleOptionToolButton()
+            button.rect = buttons[name]
+            button.text = text
+            button.palette = option.palette
+            button.font = option.font
+            button.state = QStyle.StateFlag.State_AutoRaise
+            if enabled:
+                button.state |= QStyle.StateFlag.State_Enabled
+                if option.state & QStyle.StateFlag.State_MouseOver:
+                    button.state |= QStyle.StateFlag.State_Raised
+            style.drawComplexControl(QStyle.ComplexControl.CC_ToolButton, button, painter, widget)
         
-        # 操作按钮
-        self.toggle_btn = QToolButton()
-        self.toggle_btn.clicked.connect(self._on_toggle_clicked)
-        layout.addWidget(self.toggle_btn)
-
-        self.config_btn = QToolButton()
-        self.config_btn.setText("⚙")
-        self.config_btn.setToolTip("配置")
-        self.config_btn.clicked.connect(lambda: self.config_clicked.emit(self.instance_id))
-        layout.addWidget(self.config_btn)
+        painter.restore()
+    
+    def _button_at(self, pos: QPoint, option: QStyleOptionViewItem) -> Optional[str]:
+        """鼠标位置上的按钮名称"""
+        for name, rect in self._button_rects(option.rect).items():
+            if rect.contains(pos):
+                return name
+        return None
+    
+    def editorEvent(self, event: QEvent, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if event.type() not in (QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonRelease,
+                                QEvent.Type.MouseButtonDblClick):
+            return False
+        name = self._button_at(event.position().toPoint(), option)
+        if name is None:
+            return False
         
-        self.remove_btn = QToolButton()
-        self.remove_btn.setText("✕")
-        self.remove_btn.setToolTip("移除")
-        self.remove_btn.clicked.connect(lambda: self.remove_clicked.emit(self.instance_id))
-        layout.addWidget(self.remove_btn)
-    
-    def _update_style(self, state: str):
-        """更新样式"""
-        color = self.STATE_COLORS.get(state, "#888888")
-        self.status_indicator.setStyleSheet(f"color: {color};")
-        self.state_label.setText(state)
+        # 按钮区域内的按下/双击直接吞掉，不改变选中项；松开时触发按钮
+        if event.type() != QEvent.Type.MouseButtonRelease:
+            return True
         
-        # 根据状态更新按钮可用性
-        is_running = state in ("RUNNING", "CONNECTED")
-        is_stopped = state in ("STOPPED", "DISCONNECTED", "ERROR")
-
-        if is_running:
-            self.toggle_btn.setText("⏹")
-            self.toggle_btn.setToolTip("停止")
-            self.toggle_btn.setEnabled(True)
-        elif is_stopped:
-            self.toggle_btn.setText("▶")
-            self.toggle_btn.setToolTip("启动")
-            self.toggle_btn.setEnabled(True)
-        else:
-            self.toggle_btn.setText("…")
-            self.toggle_btn.setToolTip("状态切换中")
-            self.toggle_btn.setEnabled(False)
-
-        self.remove_btn.setEnabled(is_stopped)
-
-    def _on_toggle_clicked(self):
-        """启动/停止切换"""
-        if self._state in ("RUNNING", "CONNECTED"):
-            self.stop_clicked.emit(self.instance_id)
-        elif self._state in ("STOPPED", "DISCONNECTED", "ERROR"):
-            self.start_clicked.emit(self.instance_id)
-    
-    def update_state(self, state: str):
-        """更新状态"""
-        self._state = state
-        self._update_style(state)
-    
-    def update_details(self, details: str):
-        """更新详情"""
-        self._details = details
-        self.details_label.setText(details)
-
-    def matches_filter(self, query: str) -> bool:
-        """检查是否匹配筛选条件"""
-        if not query:
+        state = index.data(InstanceListModel.StateRole)
+        if not self._button_states(state)[name][2]:
             return True
-        haystack = f"{self._name} {self._details} {self._state} {self.instance_id}".lower()
-        return query.lower() in haystack
+        
+        instance_id = index.data(InstanceListModel.IdRole)
+        if name == "toggle":
+            if state in self.RUNNING_STATES:
+                self.stop_clicked.emit(instance_id)
+            else:
+                self.start_clicked.emit(instance_id)
+        elif name == "config":
+            self.config_clicked.emit(instance_id)
+        else:
+            self.remove_clicked.emit(instance_id)
+        return True
     
-    def mousePressEvent(self, event):
-        """点击选择"""
-        self.selected.emit(self.instance_id)
-        super().mousePressEvent(event)
+    def helpEvent(self, event: QHelpEvent, view, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        name = self._button_at(event.pos(), option)
+        if name is not None and event.type() == QEvent.Type.ToolTip:
+            state = index.data(InstanceListModel.StateRole)
+            QToolTip.showText(event.globalPos(), self._button_states(state)[name][1], view)
+            return True
+        return super().helpEvent(event, view, option, index)
 
 
 class InstanceListWidget(QWidget):
@@ -267,7 +416,6 @@ class InstanceListWidget(QWidget):
     ):
         super().__init__(parent)
         self.instance_type = instance_type
-        self._items: Dict[str, InstanceItemWidget] = {}
         self._selected_id: Optional[str] = None
         
         self._init_ui()
@@ -304,19 +452,28 @@ class InstanceListWidget(QWidget):
         self.search_input.textChanged.connect(self._apply_filter)
         layout.addWidget(self.search_input)
         
-        # 实例列表容器（可滚动）
-        self.list_container = QWidget()
-        self.list_layout = QVBoxLayout(self.list_container)
-        self.list_layout.setContentsMargins(0, 0, 0, 0)
-        self.list_layout.setSpacing(4)
-        self.list_layout.addStretch()
-
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setFrameShape(QFrame.Shape.NoFrame)
-        self.scroll_area.setWidget(self.list_container)
+        # 实例列表（模型 + 代理绘制，只绘制可见行）
+        self.model = InstanceListModel(self)
+        self.delegate = InstanceItemDelegate(self)
+        self.delegate.start_clicked.connect(self.instance_started.emit)
+        self.delegate.stop_clicked.connect(self.instance_stopped.emit)
+        self.delegate.config_clicked.connect(self.instance_config_requested.emit)
+        self.delegate.remove_clicked.connect(self._on_remove_clicked)
+        
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.setSpacing(2)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setMouseTracking(True)
+        self.list_view.setFrameShape(QFrame.Shape.NoFrame)
+        self.list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.list_view.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        # 当前行变化（鼠标点击或键盘导航）时选中对应实例
+        self.list_view.selectionModel().currentChanged.connect(self._on_current_changed)
 
-        layout.addWidget(self.scroll_area)
+        layout.addWidget(self.list_view)
     
     def _on_add_clicked(self):
         """添加按钮点击"""
@@ -345,44 +502,33 @@ class InstanceListWidget(QWidget):
         details: str = ""
     ):
         """添加实例到列表"""
-        if instance_id in self._items:
+        if self.model.row_of(instance_id) >= 0:
             return
         
-        item = InstanceItemWidget(instance_id, name, state, details)
-        item.start_clicked.connect(self.instance_started.emit)
-        item.stop_clicked.connect(self.instance_stopped.emit)
-        item.config_clicked.connect(self.instance_config_requested.emit)
-        item.remove_clicked.connect(self._on_remove_clicked)
-        item.selected.connect(self._on_item_selected)
-        
-        # 插入到stretch之前
-        self.list_layout.insertWidget(self.list_layout.count() - 1, item)
-        self._items[instance_id] = item
-        self._apply_filter()
+        record = InstanceRecord(instance_id, name, state, details)
+        row = self.model.add_record(record)
+        # 新行默认可见，只有在筛选中才需要判断这一行
+        query = self.search_input.text().strip()
+        if query and not record.matches_filter(query):
+            self.list_view.setRowHidden(row, True)
     
     def remove_instance(self, instance_id: str):
         """从列表移除实例"""
-        item = self._items.get(instance_id)
-        if item:
-            self.list_layout.removeWidget(item)
-            item.deleteLater()
-            del self._items[instance_id]
-            
+        # 移除当前行时先清除当前索引，避免选择模型把相邻行设为当前行而选中另一个实例
+        if self._selected_id == instance_id:
+            self.list_view.selectionModel().clearCurrentIndex()
+        # 视图的隐藏行按持久索引记录，移除后其余行无需重新筛选
+        if self.model.remove_record(instance_id):
             if self._selected_id == instance_id:
                 self._selected_id = None
-            self._apply_filter()
     
     def update_instance_state(self, instance_id: str, state: str):
         """更新实例状态"""
-        item = self._items.get(instance_id)
-        if item:
-            item.update_state(state)
+        self.model.set_field(instance_id, "state", state, InstanceListModel.StateRole)
     
     def update_instance_details(self, instance_id: str, details: str):
         """更新实例详情"""
-        item = self._items.get(instance_id)
-        if item:
-            item.update_details(details)
+        self.model.set_field(instance_id, "details", details, InstanceListModel.DetailsRole)
     
     def get_selected_id(self) -> Optional[str]:
         """获取选中的实例ID"""
@@ -390,32 +536,39 @@ class InstanceListWidget(QWidget):
     
     def select_instance(self, instance_id: str):
         """选中指定实例"""
-        if instance_id in self._items:
+        if self.model.row_of(instance_id) >= 0:
             self._on_item_selected(instance_id)
     
     def clear(self):
         """清空列表"""
-        for instance_id in list(self._items.keys()):
-            self.remove_instance(instance_id)
+        self.model.clear_records()
+        self._selected_id = None
     
     def _on_remove_clicked(self, instance_id: str):
         """移除按钮点击"""
         self.instance_removed.emit(instance_id)
     
+    def _on_current_changed(self, current: QModelIndex, previous: QModelIndex):
+        """当前行变化（按钮区域的按下由代理处理，不会改变当前行）"""
+        if not current.isValid():
+            return
+        instance_id = current.data(InstanceListModel.IdRole)
+        if instance_id != self._selected_id:
+            self._on_item_selected(instance_id)
+    
     def _on_item_selected(self, instance_id: str):
         """实例被选中"""
-        # 更新选中状态样式
-        for iid, item in self._items.items():
-            if iid == instance_id:
-                item.setStyleSheet("background-color: #e0e8f0;")
-            else:
-                item.setStyleSheet("")
-        
+        # 先记录选中的实例，setCurrentIndex 触发的 currentChanged 不再重复发出信号；
+        # 选中状态由视图的选择模型维护，代理按选中状态绘制背景
         self._selected_id = instance_id
+        index = self.model.index(self.model.row_of(instance_id))
+        if self.list_view.currentIndex() != index:
+            self.list_view.setCurrentIndex(index)
+        
         self.instance_selected.emit(instance_id)
 
     def _apply_filter(self):
         """根据搜索框筛选实例"""
         query = self.search_input.text().strip()
-        for item in self._items.values():
-            item.setVisible(item.matches_filter(query))
+        for row, record in enumerate(self.model.records()):
+            self.list_view.setRowHidden(row, not record.matches_filter(query))
@@ -8,11 +8,12 @@ Log Widget
 
 from __future__ import annotations
 
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 from datetime import datetime
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QColor, QTextCharFormat, QTextCursor
 from PyQt6.QtWidgets import QWidget, QFileDialog
 from PyQt6 import uic
@@ -20,8 +21,11 @@ from PyQt6 import uic
 # UI文件路径
 UI_DIR = Path(__file__).parent / "ui"
 
+# UI文件在导入时编译一次，每次实例化只调用生成的 setupUi
+_LogWidgetForm, _ = uic.loadUiType(UI_DIR / "log_widget.ui")
 
-class LogWidget(QWidget):
+
+class LogWidget(QWidget, _LogWidgetForm):
     """
     日志显示控件
     
@@ -33,6 +37,7 @@ class LogWidget(QWidget):
     """
     
     log_exported = pyqtSignal(str)
+    level_changed = pyqtSignal(str)  # 过滤级别名称（大写，与 loguru 级别名一致）
     
     # 日志级别颜色
     LEVEL_COLORS = {
@@ -44,18 +49,62 @@ class LogWidget(QWidget):
         "critical": QColor("#8B0000"),
     }
     
+    # 日志级别元数据：级别 -> (过滤序号, 对齐后的级别文本, 颜色)
+    LEVEL_META = {
+        "debug": (0, "DEBUG   ", LEVEL_COLORS["debug"]),
+        "info": (1, "INFO    ", LEVEL_COLORS["info"]),
+        "success": (1, "SUCCESS ", LEVEL_COLORS["success"]),
+        "warning": (2, "WARNING ", LEVEL_COLORS["warning"]),
+        "error": (3, "ERROR   ", LEVEL_COLORS["error"]),
+        "critical": (4, "CRITICAL", LEVEL_COLORS["critical"]),
+    }
+    
+    # 日志合并刷新间隔（毫秒）
+    FLUSH_INTERVAL_MS = 50
+    
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
         self._auto_scroll = True
-        self._filter_level = "debug"
+        self._filter_order = 0  # 低于该序号的日志不显示
         self._max_lines = 5000
         
-        # 加载UI文件
-        uic.loadUi(UI_DIR / "log_widget.ui", self)
+        # 时间戳的"时:分:秒"部分按秒缓存，同一秒内只需拼接毫秒
+        self._ts_cache_sec = -1
+        self._ts_cache_str = ""
+        
+        # 面板隐藏时只记录原始日志，重新显示时再格式化写入
+        self._visible = True
+        self._hidden_buf: deque = deque(maxlen=self._max_lines)
+        
+        # 已写入行的纯文本副本，导出与获取文本时无需遍历文档
+        self._lines: deque = deque(maxlen=self._max_lines)
+        
+        # 各级别的字符格式，只构造一次
+        self._formats = {level: self._make_format(color) for level, color in self.LEVEL_COLORS.items()}
+        
+        # 待写入的日志：(字符格式, 行文本)，由单次定时器合并写入文档
+        self._pending: List[Tuple[QTextCharFormat, str]] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_logs)
+        
+        # 构建UI
+        self.setupUi(self)
+        
+        # 超出最大行数时由文档自动丢弃最早的行（末尾换行后的空块占一个块）
+        self.logText.document().setMaximumBlockCount(self._max_lines + 1)
         
         self._connect_signals()
     
+    @staticmethod
+    def _make_format(color: QColor) -> QTextCharFormat:
+        """创建指定前景色的字符格式"""
+        format = QTextCharFormat()
+        format.setForeground(color)
+        return format
+    
     def _connect_signals(self):
         """连接信号"""
         self.levelCombo.currentTextChanged.connect(self._on_level_changed)
@@ -74,65 +123,145 @@ class LogWidget(QWidget):
             message: 日志消息
             timestamp: 时间戳
         """
-        level = level.lower()
+        if not self._visible:
+            self._hidden_buf.append((level, message, timestamp or datetime.now()))
+            return
         
-        # 级别过滤
-        level_order = {"debug": 0, "info": 1, "success": 1, "warning": 2, "error": 3, "critical": 4}
-        filter_order = level_order.get(self._filter_level, 0)
-        msg_order = level_order.get(level, 0)
+        entry = self._format_entry(level, message, timestamp)
+        if entry is None:
+            return
         
-        if msg_order < filter_order:
+        # 暂存，定时器到期后一次写入文本框
+        self._pending.append(entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def append_log_batch(self, records: Iterable[Tuple[str, str, Optional[datetime]]]):
+        """
+        批量添加日志
+        
+        Args:
+            records: (级别, 消息, 时间戳) 序列，时间戳可为 None
+        """
+        if not self._visible:
+            now = datetime.now()
+            self._hidden_buf.extend((level, message, timestamp or now) for level, message, timestamp in records)
             return
         
+        format_entry = self._format_entry
+        entries = [format_entry(level, message, timestamp) for level, message, timestamp in records]
+        self._pending.extend(entry for entry in entries if entry is not None)
+        if self._pending and not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def append_core_line(self, level: str, text: str):
+        """
+        添加通信核心进程的输出
+        
+        一次读取的输出可能包含多行，逐行加上 "[core]" 前缀后批量添加，
+        每行成为一条日志
+        
+        Args:
+            level: 日志级别
+            text: 进程输出文本
+        """
+        now = datetime.now()
+        self.append_log_batch([(level, f"[core] {line}", now) for line in text.splitlines() if line])
+    
+    def _format_entry(self, level: str, message: str,
+                      timestamp: Optional[datetime]) -> Optional[Tuple[QTextCharFormat, str]]:
+        """格式化一条日志，返回 (字符格式, 行文本)；被级别过滤时返回 None"""
+        if level not in self.LEVEL_META:
+            level = level.lower()
+        meta = self.LEVEL_META.get(level)
+        if meta is None:
+            # 未知级别：按 debug 序号过滤，以原级别名显示
+            meta = (0, level.upper().ljust(8), self.LEVEL_COLORS["info"])
+        order, level_str, _ = meta
+        
+        # 级别过滤
+        if order < self._filter_order:
+            return None
+        
         # 格式化时间戳
         if timestamp is None:
             timestamp = datetime.now()
-        time_str = timestamp.strftime("%H:%M:%S.%f")[:-3]
+        second = timestamp.hour * 3600 + timestamp.minute * 60 + timestamp.second
+        if second != self._ts_cache_sec:
+            self._ts_cache_sec = second
+            self._ts_cache_str = timestamp.strftime("%H:%M:%S")
+        time_str = f"{self._ts_cache_str}.{timestamp.microsecond // 1000:03d}"
         
         # 格式化消息
-        level_str = level.upper().ljust(8)
         formatted_msg = f"[{time_str}] [{level_str}] {message}"
+        return self._formats.get(level) or self._formats["info"], formatted_msg
+    
+    def _flush_logs(self):
+        """将暂存的日志一次写入文本框"""
+        pending = self._pending
+        if not pending:
+            return
+        self._pending = []
         
-        # 设置颜色
-        color = self.LEVEL_COLORS.get(level, QColor("#000000"))
+        # 写入前是否停在底部附近（两行以内），用户向上翻看时不跳回底部
+        scrollbar = self.logText.verticalScrollBar()
+        follow = scrollbar.maximum() - scrollbar.value() <= 2 * scrollbar.singleStep()
         
-        # 添加到文本框
         cursor = self.logText.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
         
-        format = QTextCharFormat()
-        format.setForeground(color)
-        
-        cursor.insertText(formatted_msg + "\n", format)
+        # 相邻同级别的行合并为一次插入
+        start = 0
+        count = len(pending)
+        while start < count:
+            format = pending[start][0]
+            end = start + 1
+            while end < count and pending[end][0] is format:
+                end += 1
+            
+            cursor.insertText("".join(line + "\n" for _, line in pending[start:end]), format)
+            start = end
         
-        # 限制行数
-        self._limit_lines()
+        cursor.endEditBlock()
+        self._lines.extend(line for _, line in pending)
         
-        # 自动滚动
-        if self._auto_scroll:
-            scrollbar = self.logText.verticalScrollBar()
+        # 自动滚动（每批一次）
+        if self._auto_scroll and follow:
             scrollbar.setValue(scrollbar.maximum())
     
-    def _limit_lines(self):
-        """限制日志行数"""
-        document = self.logText.document()
-        if document.lineCount() > self._max_lines:
-            cursor = self.logText.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            
-            # 删除前1000行
-            for _ in range(1000):
-                cursor.movePosition(QTextCursor.MoveOperation.Down, QTextCursor.MoveMode.KeepAnchor)
-            
-            cursor.removeSelectedText()
+    def set_log_visible(self, visible: bool):
+        """
+        设置日志面板是否可见
+        
+        隐藏期间的日志暂存（最多保留最大行数条），重新可见时补写
+        """
+        if visible == self._visible:
+            return
+        self._visible = visible
+        if visible:
+            buffered = self._hidden_buf
+            self._hidden_buf = deque(maxlen=self._max_lines)
+            for level, message, timestamp in buffered:
+                self.append_log(level, message, timestamp)
     
     def clear(self):
         """清除日志"""
+        self._hidden_buf.clear()
+        self._lines.clear()
+        self._pending = []
+        self._flush_timer.stop()
         self.logText.clear()
     
     def _on_level_changed(self, level: str):
         """级别过滤变化"""
-        self._filter_level = level.lower()
+        meta = self.LEVEL_META.get(level.lower())
+        self._filter_order = meta[0] if meta else 0
+        self.level_changed.emit(level.upper())
+    
+    def get_filter_level(self) -> str:
+        """获取过滤级别名称（大写）"""
+        return self.levelCombo.currentText().upper()
     
     def _export_log(self):
         """导出日志"""
@@ -142,9 +271,10 @@ class LogWidget(QWidget):
         )
         
         if file_path:
+            self._flush_logs()
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(self.logText.toPlainText())
+                    f.write(self._plain_text())
                 self.log_exported.emit(file_path)
                 self.append_log("info", f"日志已导出到: {file_path}")
             except Exception as e:
@@ -152,8 +282,16 @@ class LogWidget(QWidget):
     
     def get_text(self) -> str:
         """获取日志文本"""
-        return self.logText.toPlainText()
+        self._flush_logs()
+        return self._plain_text()
+    
+    def _plain_text(self) -> str:
+        """由纯文本副本拼出日志文本（每行以换行结尾）"""
+        return "".join(line + "\n" for line in self._lines)
     
     def set_max_lines(self, max_lines: int):
         """设置最大行数"""
         self._max_lines = max_lines
+        self._hidden_buf = deque(self._hidden_buf, maxlen=max_lines)
+        self._lines = deque(self._lines, maxlen=max_lines)
+        self.logText.document().setMaximumBlockCount(max_lines + 1)
@@ -8,12 +8,19 @@ IEC61850仿真器主窗口，支持服务端/客户端模式切换
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import sys
+import threading
+from collections import OrderedDict, deque
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
-from PyQt6.QtCore import Qt, QSettings, pyqtSignal
-from PyQt6.QtGui import QCloseEvent, QActionGroup
+from PyQt6.QtCore import Qt, QSettings, QStandardPaths, QTimer, pyqtSignal
+from PyQt6.QtGui import QCloseEvent, QActionGroup, QStandardItem, QStandardItemModel
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout,
     QMessageBox, QLabel, QFileDialog, QDialog, QComboBox,
@@ -21,22 +28,174 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6 import uic
 
-import yaml
 from loguru import logger
 
+# 路径常量（导入时计算一次）
+_HERE = Path(__file__).parent
+_SRC_ROOT = _HERE.parent
+_PROJECT_ROOT = _SRC_ROOT.parent
+_CONFIG_PATH = _PROJECT_ROOT / "config" / "config.yaml"
+
 # 添加项目路径
-sys.path.insert(0, str(Path(__file__).parent.parent))
+if str(_SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(_SRC_ROOT))
 
-from gui.server_panel import ServerPanel
-from gui.client_panel import ClientPanel
-from gui.multi_server_panel import MultiServerPanel
-from gui.multi_client_panel import MultiClientPanel
+# 面板、核心进程与服务端代理模块在用到时才导入，只加载实际使用的那一组面板
 from gui.log_widget import LogWidget
-from backend.core_process import CoreProcessManager
-from server.server_proxy import IEC61850ServerProxy, ServerConfig
 
 # UI文件路径
-UI_DIR = Path(__file__).parent / "ui"
+UI_DIR = _HERE / "ui"
+
+# 关于对话框内容模板
+_ABOUT_TEMPLATE = """<h2>{name}</h2>
+<p>版本: {version}</p>
+<p>基于PyQt6的IEC61850协议仿真器</p>
+<p>支持服务端（IED仿真）和客户端（SCADA）两种模式</p>
+<hr>
+<p>功能特性:</p>
+<ul>
+    <li>IEC61850数据模型管理</li>
+    <li>MMS协议仿真</li>
+    <li>实时数据监控</li>
+    <li>控制操作支持</li>
+</ul>
+"""
+
+# 尚未解析网络配置代理的标记（解析结果可能为 None）
+_MISSING = object()
+
+# 进程内唯一的界面日志输出（loguru handler id）；重建主窗口时先移除旧的输出
+_ui_log_handler_id: Optional[int] = None
+
+
+def _remove_ui_log_handler():
+    """移除当前的界面日志输出（等待其队列中的日志处理完毕）"""
+    global _ui_log_handler_id
+    if _ui_log_handler_id is None:
+        return
+    try:
+        logger.remove(_ui_log_handler_id)
+    except ValueError:
+        # 已被其他代码移除（例如 logger.remove() 清空全部输出）
+        pass
+    _ui_log_handler_id = None
+
+
+def _load_yaml(stream):
+    """解析YAML，优先使用 libyaml 加速的 CSafeLoader，不可用时回退到 SafeLoader"""
+    # yaml 只在需要读写配置文件时才导入
+    import yaml
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _freeze(value):
+    """把解析得到的配置递归转为只读快照：dict 转为 MappingProxyType，list 转为 tuple"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    """_freeze 的逆操作，得到可序列化的 dict / list"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
+
+def _dump_yaml(data, stream):
+    """
+    写出YAML，优先使用 libyaml 加速的 CSafeDumper，不可用时回退到 SafeDumper
+    
+    stream 须以二进制模式打开：由发射器直接写出UTF-8字节，不再经过文本层编码
+    """
+    import yaml
+    yaml.dump(_thaw(data), stream, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+              allow_unicode=True, default_flow_style=False,
+              encoding="utf-8", width=4096)
+
+
+# YAML解析结果缓存：路径 -> ((mtime_ns, size, inode), 数据)
+_YAML_CACHE_SIZE = 100
+_yaml_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+
+
+def _load_yaml_file(path) -> Any:
+    """
+    读取YAML文件，返回只读快照（见 _freeze）
+    
+    按文件的 (mtime_ns, size, inode) 缓存解析结果，文件未变化时直接
+    返回缓存的同一份快照；快照不可修改，因此无需深拷贝
+    """
+    key = str(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            _yaml_cache.move_to_end(key)
+            return cached[1]
+    
+    # 一次读入全部字节后交给解析器，由其自行解码UTF-8，避免解析器分块读取
+    with open(key, 'rb') as f:
+        data = _freeze(_load_yaml(f.read()))
+    
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (stamp, data)
+        _yaml_cache.move_to_end(key)
+        if len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+    return data
+
+
+def _config_sidecar_path(path: Path) -> Path:
+    """配置文件的JSON副本路径：位于用户缓存目录，按配置文件的绝对路径区分"""
+    cache_dir = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation))
+    digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / "config" / f"{path.name}.{digest}.json"
+
+
+def _load_yaml_with_sidecar(path: Path) -> Any:
+    """
+    读取YAML配置，并在用户缓存目录维护一份JSON副本
+    
+    副本中记录生成时YAML文件的 (mtime_ns, size)，与当前文件一致时直接解析JSON；
+    否则（包括换成了修改时间更早的文件）解析YAML并重新写出副本。
+    JSON会把非字符串的键（整数、布尔值）改写为字符串，因此只有数据能原样
+    往返JSON时才写出副本，否则删除旧副本、始终解析YAML。
+    副本读写失败时退回解析YAML。两种方式都返回只读快照
+    """
+    cache_path = _config_sidecar_path(path)
+    st = path.stat()
+    source = [st.st_mtime_ns, st.st_size]
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached.get("source") == source:
+            return _freeze(cached["config"])
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    
+    data = _load_yaml_file(path)
+    try:
+        plain = _thaw(data)
+        text = json.dumps(plain, ensure_ascii=False)
+        if json.loads(text) == plain:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(
+                json.dumps({"source": source, "config": plain}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+        else:
+            logger.debug(f"Config {path} does not round-trip through JSON, skipping cache")
+            cache_path.unlink(missing_ok=True)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Failed to write config cache {cache_path}: {e}")
+    return data
 
 
 class MainWindow(QMainWindow):
@@ -51,7 +210,9 @@ class MainWindow(QMainWindow):
     """
     
     mode_changed = pyqtSignal(str)  # "server" 或 "client"
-    logger_message = pyqtSignal(str, str)  # level, message
+    _log_ready_signal = pyqtSignal()  # 日志队列由空变为非空
+    
+    CORE_LOG_RATE = 500  # 每秒最多显示的核心进程输出行数
     
     def __init__(self):
         super().__init__()
@@ -63,9 +224,22 @@ class MainWindow(QMainWindow):
         # 加载UI文件
         uic.loadUi(UI_DIR / "main_window.ui", self)
         
-        self._network_proxy = None
+        # 网络接口配置所用的代理在首次打开网卡对话框时解析并缓存
+        self._network_proxy: Any = _MISSING
+        ipc_config = self.config.get("ipc", {})
+        self._ipc_socket_path = ipc_config.get("socket_path", "/tmp/iec61850_simulator.sock")
+        self._ipc_timeout_ms = ipc_config.get("request_timeout_ms", 3000)
+        
+        # 加载/保存配置共用的文件对话框，首次使用时创建
+        self._config_file_dialog: Optional[QFileDialog] = None
+        self._log_handler_id: Optional[int] = None
+        
+        # loguru 后台线程写入、主线程取出的日志队列：(级别, 消息, 时间)；
+        # 队列已有待取出的日志时不再发信号，每批只切换一次线程
+        self._log_queue: deque = deque()
+        self._log_drain_scheduled = False
 
-        self.logger_message.connect(self._append_log_message)
+        self._log_ready_signal.connect(self._drain_log_queue)
 
         self._init_ui()
         self._init_panels()
@@ -75,20 +249,19 @@ class MainWindow(QMainWindow):
         self._setup_logging()
         self._init_core_process()
     
-    def _load_config(self) -> dict:
-        """加载配置文件"""
-        config_path = Path(__file__).parent.parent.parent / "config" / "config.yaml"
+    def _load_config(self) -> Mapping:
+        """加载配置文件（只读快照）"""
+        config_path = _CONFIG_PATH
         try:
             if config_path.exists():
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    return yaml.safe_load(f)
+                return _load_yaml_with_sidecar(config_path)
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
         
-        return {
+        return _freeze({
             "application": {"name": "IEC61850 Simulator", "version": "1.0.0"},
             "gui": {"window": {"width": 1400, "height": 900}}
-        }
+        })
     
     def _init_ui(self):
         """初始化UI附加设置"""
@@ -116,6 +289,9 @@ class MainWindow(QMainWindow):
         multi_instance = self.config.get("gui", {}).get("multi_instance", True)
         
         if multi_instance:
+            from gui.multi_server_panel import MultiServerPanel
+            from gui.multi_client_panel import MultiClientPanel
+            
             # 多实例服务端面板
             self.server_panel = MultiServerPanel(self.config)
             self.panelStack.addWidget(self.server_panel)
@@ -124,6 +300,9 @@ class MainWindow(QMainWindow):
             self.client_panel = MultiClientPanel(self.config)
             self.panelStack.addWidget(self.client_panel)
         else:
+            from gui.server_panel import ServerPanel
+            from gui.client_panel import ClientPanel
+            
             # 单实例服务端面板
             self.server_panel = ServerPanel(self.config)
             self.panelStack.addWidget(self.server_panel)
@@ -138,13 +317,16 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.addWidget(self.log_widget)
         
-        # 连接面板日志
+        # 连接面板日志（直接连接到 append_log，排队在主线程执行）
         self.server_panel.log_message.connect(
-            lambda level, msg: self.log_widget.append_log(level, msg)
+            self.log_widget.append_log, Qt.ConnectionType.QueuedConnection
         )
         self.client_panel.log_message.connect(
-            lambda level, msg: self.log_widget.append_log(level, msg)
+            self.log_widget.append_log, Qt.ConnectionType.QueuedConnection
         )
+        if multi_instance:
+            # 多实例客户端面板的实例日志按批发出
+            self.client_panel.log_batch.connect(self.log_widget.append_log_batch)
     
     def _connect_signals(self):
         """连接信号"""
@@ -168,6 +350,9 @@ class MainWindow(QMainWindow):
         self.actionStart.triggered.connect(self._on_start)
         self.actionStop.triggered.connect(self._on_stop)
         self.actionRefresh.triggered.connect(self._on_refresh)
+        
+        # 客户端连接在后台完成，工具栏与状态栏按连接结果更新
+        self.client_panel.connection_finished.connect(self._on_client_connection_finished)
     
     def _init_statusbar_widgets(self):
         """初始化状态栏控件"""
@@ -190,36 +375,108 @@ class MainWindow(QMainWindow):
     def _restore_geometry(self):
         """恢复窗口几何位置"""
         geometry = self.settings.value("geometry")
+        # 记录已保存的值，关闭时几何位置未变化则不再写入
+        self._saved_geometry = geometry
         if geometry:
             self.restoreGeometry(geometry)
     
     def _setup_logging(self):
-        """设置日志"""
+        """
+        设置日志
+        
+        enqueue=True 时日志记录先放入队列，由 loguru 的后台线程调用
+        log_handler，产生日志的线程不会等待界面；log_handler 把消息放入
+        _log_queue，只在队列中没有待处理日志时通过信号通知主线程取出。
+        
+        输出级别与日志面板的过滤级别保持一致，被过滤的日志在 loguru
+        内部即被丢弃，不会进入队列
+        """
+        self._add_log_handler(self.log_widget.get_filter_level())
+        self.log_widget.level_changed.connect(self._on_log_level_changed)
+    
+    def _add_log_handler(self, level: str):
+        """按指定级别添加界面日志输出"""
+        queue = self._log_queue
+        emit = self._log_ready_signal.emit
+        
         def log_handler(message):
             record = message.record
-            level = record["level"].name.lower()
-            text = record["message"]
-            self.logger_message.emit(level, text)
+            queue.append((record["level"].name.lower(), record["message"], record["time"]))
+            if not self._log_drain_scheduled:
+                self._log_drain_scheduled = True
+                emit()
         
-        logger.add(log_handler, format="{message}", level="DEBUG")
+        global _ui_log_handler_id
+        _remove_ui_log_handler()
+        _ui_log_handler_id = logger.add(log_handler, format="{message}", level=level, enqueue=True)
+        self._log_handler_id = _ui_log_handler_id
+    
+    def _on_log_level_changed(self, level: str):
+        """日志面板过滤级别变化，按新级别重新添加输出"""
+        # 输出已被移除，或已被新建的主窗口接管
+        if self._log_handler_id is None or self._log_handler_id != _ui_log_handler_id:
+            return
+        self._add_log_handler(level)
 
-    def _append_log_message(self, level: str, text: str):
-        """在主线程追加日志"""
-        self.log_widget.append_log(level, text)
+    def _drain_log_queue(self):
+        """在主线程取出队列中的全部日志并追加到日志面板"""
+        # 先清除标志再取出：取出期间新加入的日志要么在本次取出，要么会再次发信号
+        self._log_drain_scheduled = False
+        queue = self._log_queue
+        popleft = queue.popleft
+        self.log_widget.append_log_batch([popleft() for _ in range(len(queue))])
 
     def _init_core_process(self):
         """初始化并启动通信核心进程"""
-        project_root = Path(__file__).parent.parent.parent
-        self.core_process = CoreProcessManager(self.config, project_root, self)
+        from backend.core_process import CoreProcessManager
+        
+        self.core_process = CoreProcessManager(self.config, _PROJECT_ROOT, self)
+        
+        # 令牌桶限制核心进程输出刷屏：每秒最多显示 CORE_LOG_RATE 行，
+        # 超出部分丢弃并在窗口结束时汇总提示一次
+        self._core_log_tokens = self.CORE_LOG_RATE
+        self._core_log_suppressed = 0
+        self._core_log_timer = QTimer(self)
+        self._core_log_timer.setSingleShot(True)
+        self._core_log_timer.setInterval(1000)
+        self._core_log_timer.timeout.connect(self._refill_core_log_tokens)
 
-        self.core_process.output.connect(lambda msg: self.log_widget.append_log("info", f"[core] {msg}"))
-        self.core_process.error_output.connect(lambda msg: self.log_widget.append_log("error", f"[core] {msg}"))
+        self.core_process.output.connect(partial(self._on_core_output, "info"))
+        self.core_process.error_output.connect(partial(self._on_core_output, "error"))
         self.core_process.state_changed.connect(lambda state: self.info_label.setText(f"Core: {state}"))
 
         core_config = self.config.get("core", {})
         if core_config.get("auto_start", True):
             self.core_process.start()
     
+    def _on_core_output(self, level: str, text: str):
+        """核心进程输出，按令牌桶限流后写入日志面板"""
+        if not self._core_log_timer.isActive():
+            self._core_log_timer.start()
+        
+        lines = [line for line in text.splitlines() if line]
+        tokens = self._core_log_tokens
+        if len(lines) > tokens:
+            self._core_log_suppressed += len(lines) - tokens
+            lines = lines[:tokens]
+        if not lines:
+            return
+        self._core_log_tokens = tokens - len(lines)
+        self.log_widget.append_core_line(level, "\n".join(lines))
+    
+    def _refill_core_log_tokens(self):
+        """限流窗口结束：补满令牌，并汇总提示被丢弃的输出"""
+        self._core_log_tokens = self.CORE_LOG_RATE
+        self._flush_core_log_suppressed()
+    
+    def _flush_core_log_suppressed(self):
+        """提示一次累计丢弃的输出行数，提示后清零"""
+        suppressed = self._core_log_suppressed
+        if not suppressed:
+            return
+        self._core_log_suppressed = 0
+        self.log_widget.append_log("warning", f"[core] 输出过多，已丢弃 {suppressed} 行")
+    
     # ========================================================================
     # 事件处理
     # ========================================================================
@@ -245,23 +502,19 @@ class MainWindow(QMainWindow):
         logger.info(f"Switched to {self.current_mode} mode")
 
     def _get_network_proxy(self):
-        """获取用于网络接口配置的代理"""
-        if self._network_proxy:
+        """获取用于网络接口配置的代理（解析一次后缓存，包括解析失败的结果）"""
+        if self._network_proxy is not _MISSING:
             return self._network_proxy
 
-        proxy = None
-        if hasattr(self.server_panel, "server") and self.server_panel.server:
-            proxy = self.server_panel.server
-        elif hasattr(self.server_panel, "instance_manager"):
-            for instance in self.server_panel.instance_manager.get_all_instances():
-                proxy = instance.proxy
-                break
+        # ServerPanel 与 MultiServerPanel 都提供 server / instance_manager 属性
+        panel = self.server_panel
+        proxy = panel.server
+        if not proxy and panel.instance_manager is not None:
+            proxy = next((instance.proxy for instance in panel.instance_manager.get_all_instances()), None)
 
         if not proxy:
-            ipc_config = self.config.get("ipc", {})
-            socket_path = ipc_config.get("socket_path", "/tmp/iec61850_simulator.sock")
-            timeout_ms = ipc_config.get("request_timeout_ms", 3000)
-            proxy = IEC61850ServerProxy(ServerConfig(), socket_path, timeout_ms)
+            from server.server_proxy import IEC61850ServerProxy, ServerConfig
+            proxy = IEC61850ServerProxy(ServerConfig(), self._ipc_socket_path, self._ipc_timeout_ms)
 
         self._network_proxy = proxy
         return proxy
@@ -284,16 +537,21 @@ class MainWindow(QMainWindow):
 
         layout = QFormLayout(dialog)
         combo = QComboBox(dialog)
-        combo.addItem("(未选择)", None)
 
+        # 先在模型中构建全部条目，再一次设置给下拉框
+        items = [QStandardItem("(未选择)")]
         for iface in interfaces:
-            name = iface.get("name", "")
-            is_up = iface.get("is_up", False)
-            addresses = iface.get("addresses", [])
-            status = "UP" if is_up else "DOWN"
+            get = iface.get
+            name = get("name", "")
+            status = "UP" if get("is_up", False) else "DOWN"
+            addresses = get("addresses", [])
             addr_str = ", ".join(addresses[:2]) if addresses else "无IP"
-            display_text = f"{name} [{status}] - {addr_str}"
-            combo.addItem(display_text, name)
+            item = QStandardItem(f"{name} [{status}] - {addr_str}")
+            item.setData(name, Qt.ItemDataRole.UserRole)
+            items.append(item)
+        model = QStandardItemModel(combo)
+        model.invisibleRootItem().appendRows(items)
+        combo.setModel(model)
 
         prefix_spin = QSpinBox(dialog)
         prefix_spin.setRange(1, 32)
@@ -302,10 +560,9 @@ class MainWindow(QMainWindow):
         if current:
             current_name = current.get("name", "")
             prefix_len = current.get("prefix_len", 24)
-            for i in range(combo.count()):
-                if combo.itemData(i) == current_name:
-                    combo.setCurrentIndex(i)
-                    break
+            index = combo.findData(current_name)
+            if index >= 0:
+                combo.setCurrentIndex(index)
             prefix_spin.setValue(prefix_len)
 
         layout.addRow("网络接口:", combo)
@@ -339,10 +596,16 @@ class MainWindow(QMainWindow):
                 self.actionStop.setEnabled(True)
                 self.status_label.setText("服务运行中")
         else:
-            if self.client_panel.connect():
-                self.actionStart.setEnabled(False)
-                self.actionStop.setEnabled(True)
-                self.status_label.setText("已连接")
+            # 连接结果由 _on_client_connection_finished 处理
+            self.client_panel.connect()
+    
+    def _on_client_connection_finished(self, success: bool):
+        """客户端连接完成"""
+        if not success or self.current_mode != "client":
+            return
+        self.actionStart.setEnabled(False)
+        self.actionStop.setEnabled(True)
+        self.status_label.setText("已连接")
     
     def _on_stop(self):
         """停止/断开"""
@@ -365,17 +628,42 @@ class MainWindow(QMainWindow):
     def _toggle_log_panel(self, checked: bool):
         """切换日志面板显示"""
         self.logWidgetContainer.setVisible(checked)
+        self.log_widget.set_log_visible(checked)
+    
+    def _choose_config_file(self, title: str, accept_mode: QFileDialog.AcceptMode) -> str:
+        """
+        选择配置文件
+        
+        文件对话框只创建一次，之后每次打开复用同一实例
+        
+        Returns:
+            所选文件路径，取消时返回空字符串
+        """
+        dialog = self._config_file_dialog
+        if dialog is None:
+            dialog = QFileDialog(self)
+            dialog.setNameFilters(["YAML Files (*.yaml *.yml)", "All Files (*)"])
+            self._config_file_dialog = dialog
+        
+        dialog.setWindowTitle(title)
+        dialog.setAcceptMode(accept_mode)
+        if accept_mode == QFileDialog.AcceptMode.AcceptOpen:
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        else:
+            dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return ""
+        files = dialog.selectedFiles()
+        return files[0] if files else ""
     
     def _on_load_config(self):
         """加载配置"""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "加载配置文件", "", "YAML Files (*.yaml *.yml);;All Files (*)"
-        )
+        file_path = self._choose_config_file("加载配置文件", QFileDialog.AcceptMode.AcceptOpen)
         
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    self.config = yaml.safe_load(f)
+                self.config = _load_yaml_file(file_path)
                 logger.info(f"Loaded config from {file_path}")
                 QMessageBox.information(self, "成功", "配置加载成功！")
             except Exception as e:
@@ -384,14 +672,12 @@ class MainWindow(QMainWindow):
     
     def _on_save_config(self):
         """保存配置"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "保存配置文件", "", "YAML Files (*.yaml *.yml);;All Files (*)"
-        )
+        file_path = self._choose_config_file("保存配置文件", QFileDialog.AcceptMode.AcceptSave)
         
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    yaml.dump(self.config, f, allow_unicode=True, default_flow_style=False)
+                with open(file_path, 'wb') as f:
+                    _dump_yaml(self.config, f)
                 logger.info(f"Saved config to {file_path}")
                 QMessageBox.information(self, "成功", "配置保存成功！")
             except Exception as e:
@@ -404,19 +690,10 @@ class MainWindow(QMainWindow):
         QMessageBox.about(
             self,
             "关于",
-            f"""<h2>{app_config.get('name', 'IEC61850 Simulator')}</h2>
-            <p>版本: {app_config.get('version', '1.0.0')}</p>
-            <p>基于PyQt6的IEC61850协议仿真器</p>
-            <p>支持服务端（IED仿真）和客户端（SCADA）两种模式</p>
-            <hr>
-            <p>功能特性:</p>
-            <ul>
-                <li>IEC61850数据模型管理</li>
-                <li>MMS协议仿真</li>
-                <li>实时数据监控</li>
-                <li>控制操作支持</li>
-            </ul>
-            """
+            _ABOUT_TEMPLATE.format(
+                name=app_config.get('name', 'IEC61850 Simulator'),
+                version=app_config.get('version', '1.0.0'),
+            )
         )
     
     def closeEvent(self, event: QCloseEvent):
@@ -426,12 +703,23 @@ class MainWindow(QMainWindow):
             self.server_panel.stop_server()
         else:
             self.client_panel.disconnect()
+        # 结束客户端工作线程（等待已提交的断开请求处理完毕）
+        self.client_panel.shutdown()
 
         if hasattr(self, "core_process"):
             self.core_process.stop()
         
-        # 保存窗口几何位置
-        self.settings.setValue("geometry", self.saveGeometry())
+        # 移除本窗口的界面日志输出
+        if self._log_handler_id is not None and self._log_handler_id == _ui_log_handler_id:
+            _remove_ui_log_handler()
+        self._log_handler_id = None
+        
+        # 保存窗口几何位置（仅在变化时写入，并在关闭时统一同步一次）
+        geometry = self.saveGeometry()
+        if geometry != self._saved_geometry:
+            self.settings.setValue("geometry", geometry)
+            self._saved_geometry = geometry
+            self.settings.sync()
         
         event.accept()
     
@@ -8,23 +8,38 @@ Multi-Instance Client Panel
 from __future__ import annotations
 
 import sys
+from collections import ChainMap
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QMargins, pyqtSignal, pyqtSlot, QTimer
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QStackedWidget, QLabel, QMessageBox
 )
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_SRC_ROOT = str(Path(__file__).parent.parent)
+if _SRC_ROOT not in sys.path:
+    sys.path.insert(0, _SRC_ROOT)
 
 from gui.instance_list_widget import InstanceListWidget
 from gui.client_panel import ClientPanel
 from client.instance_manager import ClientInstanceManager, ClientInstance
 from client.client_proxy import ClientConfig, ClientState
 
+# 左侧实例列表区域的内边距
+_LEFT_PANEL_MARGINS = QMargins(4, 4, 4, 4)
+
+
+@dataclass(slots=True)
+class _InstanceEntry:
+    """面板为每个实例缓存的信息"""
+    state: ClientState  # 最近一次收到的状态
+    log_prefix: str  # 日志前缀 "[实例名] "
+
 
 class MultiClientPanel(QWidget):
     """
@@ -38,12 +53,38 @@ class MultiClientPanel(QWidget):
     """
     
     log_message = pyqtSignal(str, str)  # level, message
+    log_batch = pyqtSignal(list)  # [(level, message, timestamp)]，实例日志按批发出
+    connection_finished = pyqtSignal(bool)  # 连接请求完成（是否成功），与单实例面板一致
+    # 实例管理器回调可能来自客户端工作线程，经信号转到界面线程处理
+    _instance_added_signal = pyqtSignal(object)
+    _instance_removed_signal = pyqtSignal(str)
+    _instance_state_signal = pyqtSignal(str, object)
+    _instance_log_signal = pyqtSignal(str, str, str)
+    
+    # 实例日志的合并发送间隔（毫秒）
+    LOG_FLUSH_INTERVAL_MS = 16
     
     def __init__(self, config: Dict, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
         self.config = config
         self._current_instance_id: Optional[str] = None
+        # 统计信息合并刷新：同一轮事件循环内的多次请求只更新一次标签
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.setInterval(0)
+        self._stats_timer.timeout.connect(self._do_update_stats)
+        self._last_stats: Optional[tuple] = None
+        # 实例日志先缓存，每 LOG_FLUSH_INTERVAL_MS 毫秒通过 log_batch 发出一次
+        self._log_buffer: List[Tuple[str, str, datetime]] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_logs)
+        # 由回调增量维护的实例信息与已连接数：刷新统计时无需遍历全部实例，
+        # 写日志时无需再查询实例名
+        self._entries: Dict[str, _InstanceEntry] = {}
+        self._connected_count = 0
         
         # 初始化实例管理器
         ipc_config = config.get("ipc", {})
@@ -57,11 +98,21 @@ class MultiClientPanel(QWidget):
         self._connect_signals()
     
     def _setup_manager_callbacks(self):
-        """设置实例管理器回调"""
-        self.instance_manager.on_instance_added(self._on_instance_added)
-        self.instance_manager.on_instance_removed(self._on_instance_removed)
-        self.instance_manager.on_instance_state_change(self._on_instance_state_change)
-        self.instance_manager.on_log(self._on_instance_log)
+        """
+        设置实例管理器回调
+        
+        回调只发出信号；在界面线程中发出时直接调用处理函数，
+        在其他线程中发出时排队到界面线程执行
+        """
+        self._instance_added_signal.connect(self._on_instance_added)
+        self._instance_removed_signal.connect(self._on_instance_removed)
+        self._instance_state_signal.connect(self._on_instance_state_change)
+        self._instance_log_signal.connect(self._on_instance_log)
+        
+        self.instance_manager.on_instance_added(self._instance_added_signal.emit)
+        self.instance_manager.on_instance_removed(self._instance_removed_signal.emit)
+        self.instance_manager.on_instance_state_change(self._instance_state_signal.emit)
+        self.instance_manager.on_log(self._instance_log_signal.emit)
     
     def _init_ui(self):
         """初始化UI"""
@@ -71,7 +122,7 @@ class MultiClientPanel(QWidget):
         # 左侧：实例列表
         left_panel = QWidget()
         left_layout = QVBoxLayout(left_panel)
-        left_layout.setContentsMargins(4, 4, 4, 4)
+        left_layout.setContentsMargins(_LEFT_PANEL_MARGINS)
         
         self.instance_list = InstanceListWidget("client")
         left_layout.addWidget(self.instance_list)
@@ -87,27 +138,27 @@ class MultiClientPanel(QWidget):
         # 右侧：实例详情
         self.detail_stack = QStackedWidget()
         
-        # 空白占位页面
-        empty_page = QWidget()
-        empty_layout = QVBoxLayout(empty_page)
-        empty_label = QLabel("请选择或创建一个客户端实例")
-        empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        empty_label.setStyleSheet("color: #888; font-size: 14px;")
-        empty_layout.addWidget(empty_label)
-        self.detail_stack.addWidget(empty_page)
+        self.detail_stack.addWidget(self._make_empty_page())
         
         # 分割器
         splitter = QSplitter(Qt.Orientation.Horizontal)
         splitter.addWidget(left_panel)
         splitter.addWidget(self.detail_stack)
         splitter.setSizes([280, 720])
-        splitter.setStretchFactor(0, 0)
         splitter.setStretchFactor(1, 1)
         
         layout.addWidget(splitter)
         
-        # 实例面板映射
-        self._instance_panels: Dict[str, ClientPanel] = {}
+        # 共享详情面板（所有实例共用一个，首次选中实例时创建）
+        self._shared_panel: Optional[ClientPanel] = None
+    
+    @staticmethod
+    def _make_empty_page() -> QLabel:
+        """空白占位页面：居中的提示标签直接作为页面，无需额外的容器和布局"""
+        page = QLabel("请选择或创建一个客户端实例")
+        page.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        page.setStyleSheet("color: #888; font-size: 14px;")
+        return page
     
     def _connect_signals(self):
         """连接信号"""
@@ -121,6 +172,7 @@ class MultiClientPanel(QWidget):
     # 实例操作
     # =========================================================================
     
+    @pyqtSlot(dict)
     def _on_create_instance(self, config: Dict):
         """创建实例"""
         try:
@@ -135,27 +187,35 @@ class MultiClientPanel(QWidget):
             instance.target_host = config.get("host", "127.0.0.1")
             instance.target_port = config.get("port", 102)
             
-            # 创建对应的面板
-            self._create_instance_panel(instance)
+            # 选中新实例，共享面板随之绑定到该实例
+            self.instance_list.select_instance(instance.id)
             
         except ValueError as e:
             QMessageBox.warning(self, "创建失败", str(e))
     
+    @pyqtSlot(str)
     def _on_remove_instance(self, instance_id: str):
-        """移除实例"""
+        """移除实例（确认框以窗口模态打开，不进入嵌套事件循环）"""
         instance = self.instance_manager.get_instance(instance_id)
         if not instance:
             return
         
-        reply = QMessageBox.question(
-            self, "确认移除",
+        box = QMessageBox(
+            QMessageBox.Icon.Question, "确认移除",
             f"确定要移除实例 '{instance.name}' 吗?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            self,
         )
-        
-        if reply == QMessageBox.StandardButton.Yes:
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.finished.connect(partial(self._on_remove_confirmed, box, instance_id))
+        box.open()
+    
+    def _on_remove_confirmed(self, box: QMessageBox, instance_id: str, _result: int):
+        """移除确认框关闭"""
+        if box.standardButton(box.clickedButton()) == QMessageBox.StandardButton.Yes:
             self.instance_manager.remove_instance(instance_id)
     
+    @pyqtSlot(str)
     def _on_connect_instance(self, instance_id: str):
         """连接实例"""
         instance = self.instance_manager.get_instance(instance_id)
@@ -166,18 +226,33 @@ class MultiClientPanel(QWidget):
                 instance.target_port
             )
     
+    @pyqtSlot(str)
     def _on_disconnect_instance(self, instance_id: str):
         """断开实例"""
         self.instance_manager.disconnect_instance(instance_id)
     
+    @pyqtSlot(str)
     def _on_select_instance(self, instance_id: str):
         """选择实例"""
+        # 列表重复发出同一实例的选择时无需再切换页面
+        if instance_id == self._current_instance_id:
+            return
         self._current_instance_id = instance_id
         
-        # 切换详情面板
-        panel = self._instance_panels.get(instance_id)
-        if panel:
-            self.detail_stack.setCurrentWidget(panel)
+        instance = self.instance_manager.get_instance(instance_id)
+        if not instance:
+            self.detail_stack.setCurrentIndex(0)
+            return
+        
+        # 代理为所有实例共用，实例状态取自面板按实例跟踪的记录
+        entry = self._entries.get(instance_id)
+        state = entry.state if entry is not None else ClientState.DISCONNECTED
+        panel = self._get_shared_panel()
+        panel.bind_instance(
+            instance_id, instance.proxy, state, self._instance_config(instance),
+            instance.target_host, instance.target_port
+        )
+        self.detail_stack.setCurrentWidget(panel)
     
     # =========================================================================
     # 实例管理器回调
@@ -185,52 +260,73 @@ class MultiClientPanel(QWidget):
     
     def _on_instance_added(self, instance: ClientInstance):
         """实例添加回调"""
+        # instance.state 读取的是共用代理的状态，新建实例总是从未连接开始，
+        # 之后的状态由 _on_instance_state_change 按实例跟踪
+        state = ClientState.DISCONNECTED
         details = f"→ {instance.target_host}:{instance.target_port}"
         self.instance_list.add_instance(
             instance.id,
             instance.name,
-            instance.state.name,
+            state.name,
             details
         )
+        self._entries[instance.id] = _InstanceEntry(state, f"[{instance.name}] ")
         self._update_stats()
     
     def _on_instance_removed(self, instance_id: str):
         """实例移除回调"""
+        entry = self._entries.pop(instance_id, None)
+        if entry is not None and entry.state == ClientState.CONNECTED:
+            self._connected_count -= 1
         self.instance_list.remove_instance(instance_id)
         
-        # 移除面板
-        panel = self._instance_panels.pop(instance_id, None)
-        if panel:
-            self.detail_stack.removeWidget(panel)
-            panel.deleteLater()
-        
         # 如果移除的是当前选中的，切换到空白页
         if self._current_instance_id == instance_id:
             self._current_instance_id = None
             self.detail_stack.setCurrentIndex(0)
+            if self._shared_panel is not None:
+                self._shared_panel.unbind_instance()
         
         self._update_stats()
     
     def _on_instance_state_change(self, instance_id: str, state: ClientState):
         """实例状态变化回调"""
+        entry = self._entries.get(instance_id)
+        if entry is not None:
+            self._connected_count += (
+                (state == ClientState.CONNECTED) - (entry.state == ClientState.CONNECTED)
+            )
+            entry.state = state
         self.instance_list.update_instance_state(instance_id, state.name)
         self._update_stats()
     
     def _on_instance_log(self, instance_id: str, level: str, message: str):
         """实例日志回调"""
-        instance = self.instance_manager.get_instance(instance_id)
-        name = instance.name if instance else instance_id
-        self.log_message.emit(level, f"[{name}] {message}")
+        entry = self._entries.get(instance_id)
+        prefix = entry.log_prefix if entry is not None else f"[{instance_id}] "
+        self._log_buffer.append((level, prefix + message, datetime.now()))
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_logs(self):
+        """发出缓存的实例日志"""
+        buffer, self._log_buffer = self._log_buffer, []
+        if buffer:
+            self.log_batch.emit(buffer)
+    
+    @pyqtSlot(str, str)
+    def _forward_panel_log(self, level: str, message: str):
+        """转发共享面板的日志，面板的日志总是属于当前选中的实例"""
+        if self._current_instance_id is not None:
+            self._on_instance_log(self._current_instance_id, level, message)
     
     # =========================================================================
     # 面板管理
     # =========================================================================
     
-    def _create_instance_panel(self, instance: ClientInstance):
-        """为实例创建配置面板"""
-        # 创建单独的配置副本
-        instance_config = dict(self.config)
-        instance_config["client"] = {
+    def _instance_config(self, instance: ClientInstance) -> ChainMap:
+        """以实例自己的 client 部分覆盖共享的应用配置，不复制整份配置"""
+        client_config = {
             "connection": {
                 "timeout_ms": instance.config.timeout_ms,
                 "retry_count": instance.config.retry_count,
@@ -247,28 +343,30 @@ class MultiClientPanel(QWidget):
                 }
             ]
         }
-        
-        panel = ClientPanel(instance_config, self)
-        panel.client = instance.proxy
-        panel.log_message.connect(
-            lambda level, msg, iid=instance.id: self._on_instance_log(iid, level, msg)
-        )
-        
-        # 预填充连接信息
-        panel.ipInput.setText(instance.target_host)
-        panel.portInput.setValue(instance.target_port)
-        
-        self._instance_panels[instance.id] = panel
-        self.detail_stack.addWidget(panel)
-        
-        # 自动选中新创建的实例
-        self.instance_list.select_instance(instance.id)
+        return ChainMap({"client": client_config}, self.config)
+    
+    def _get_shared_panel(self) -> ClientPanel:
+        """获取共享详情面板，首次使用时创建"""
+        panel = self._shared_panel
+        if panel is None:
+            panel = ClientPanel(self.config, self)
+            panel.log_message.connect(self._forward_panel_log)
+            self.detail_stack.addWidget(panel)
+            self._shared_panel = panel
+        return panel
     
     def _update_stats(self):
-        """更新统计信息"""
-        total = self.instance_manager.get_instance_count()
-        connected = self.instance_manager.get_connected_count()
-        self.stats_label.setText(f"实例: {total} | 已连接: {connected}")
+        """请求更新统计信息（推迟到本轮事件处理结束后合并执行）"""
+        if not self._stats_timer.isActive():
+            self._stats_timer.start()
+    
+    def _do_update_stats(self):
+        """更新统计信息，数值未变化时不重设标签文本"""
+        stats = (len(self._entries), self._connected_count)
+        if stats == self._last_stats:
+            return
+        self._last_stats = stats
+        self.stats_label.setText("实例: {} | 已连接: {}".format(*stats))
     
     # =========================================================================
     # 公共方法
@@ -288,6 +386,11 @@ class MultiClientPanel(QWidget):
         """断开所有实例"""
         self.instance_manager.disconnect_all_instances()
     
+    def shutdown(self):
+        """结束共享详情面板的工作线程"""
+        if self._shared_panel is not None:
+            self._shared_panel.shutdown()
+    
     def get_current_instance(self) -> Optional[ClientInstance]:
         """获取当前选中的实例"""
         if self._current_instance_id:
@@ -305,13 +408,16 @@ class MultiClientPanel(QWidget):
     def connect(self) -> bool:
         """连接当前选中的客户端实例（兼容单实例接口）"""
         instance = self.get_current_instance()
-        if instance:
-            return self.instance_manager.connect_instance(
-                instance.id,
-                instance.target_host,
-                instance.target_port
-            )
-        return False
+        if not instance:
+            return False
+        
+        success = self.instance_manager.connect_instance(
+            instance.id,
+            instance.target_host,
+            instance.target_port
+        )
+        self.connection_finished.emit(success)
+        return success
     
     def disconnect(self):
         """断开当前选中的客户端实例（兼容单实例接口）"""
@@ -321,19 +427,30 @@ class MultiClientPanel(QWidget):
     
     def refresh_data(self):
         """刷新当前选中实例的数据（兼容单实例接口）"""
-        panel = self._instance_panels.get(self._current_instance_id)
-        if panel and hasattr(panel, 'refresh_data'):
-            panel.refresh_data()
+        if self._current_instance_id and self._shared_panel is not None:
+            self._shared_panel.refresh_data()
     
     def save_instances(self, file_path: str) -> bool:
         """保存所有实例配置到文件"""
         return self.instance_manager.save_to_file(file_path)
     
     def load_instances(self, file_path: str, auto_connect: bool = False) -> int:
-        """从文件加载实例配置"""
-        count = self.instance_manager.load_from_file(file_path, auto_connect)
-        # 为加载的实例创建面板
-        for instance in self.instance_manager.get_all_instances():
-            if instance.id not in self._instance_panels:
-                self._create_instance_panel(instance)
+        """
+        从文件加载实例配置
+        
+        加载期间暂停实例列表的重绘，加载完成后选中最后一个新实例
+        """
+        known = set(self._entries)
+        self.instance_list.setUpdatesEnabled(False)
+        try:
+            count = self.instance_manager.load_from_file(file_path, auto_connect)
+        finally:
+            self.instance_list.setUpdatesEnabled(True)
+        
+        last_added: Optional[str] = None
+        for instance_id in self._entries:
+            if instance_id not in known:
+                last_added = instance_id
+        if last_added is not None:
+            self.instance_list.select_instance(last_added)
         return count
@@ -7,7 +7,9 @@ Multi-Instance Server Panel
 
 from __future__ import annotations
 
+import os
 import sys
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Optional
@@ -21,7 +23,9 @@ from PyQt6.QtWidgets import (
     QDialog, QFormLayout, QLineEdit, QSpinBox, QCheckBox, QDialogButtonBox
 )
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_SRC_ROOT = str(Path(__file__).parent.parent)
+if _SRC_ROOT not in sys.path:
+    sys.path.insert(0, _SRC_ROOT)
 
 from gui.instance_list_widget import InstanceListWidget
 from gui.server_panel import ServerPanel
@@ -31,22 +35,49 @@ from server.server_proxy import ServerConfig, ServerState
 
 
 class _SCDParseWorker(QObject):
+    # 解析缓存最多保留的 SCD 文件数（按最近使用淘汰）
+    CACHE_SIZE = 4
+
     parsed = pyqtSignal(list)
     failed = pyqtSignal(str)
     finished = pyqtSignal()
 
-    def __init__(self, scd_path: str):
+    def __init__(self, scd_path: str, cache: Optional[OrderedDict] = None):
         super().__init__()
         self._scd_path = scd_path
+        # 由 MultiServerPanel 持有的 XML 解析缓存，键为 (路径, mtime, 大小)，
+        # 值为 (解析器, IED 元素列表)
+        self._cache = cache if cache is not None else OrderedDict()
         self._cancelled = False
 
     def cancel(self) -> None:
         self._cancelled = True
 
+    def _split(self) -> tuple:
+        """
+        取得文件的 (解析器, IED 元素列表)，文件未变化时复用缓存
+        
+        缓存只保存 XML 子树而不保存 IED 对象：实例会修改 IED 中的数据值，
+        每次导入都由未被修改的 XML 重新构建模型，无需深拷贝
+        """
+        st = os.stat(self._scd_path)
+        key = (os.path.abspath(self._scd_path), st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        parser = SCDParser()
+        cached = (parser, parser.split_ieds(self._scd_path))
+        self._cache[key] = cached
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return cached
+
     def run(self) -> None:
         try:
-            parser = SCDParser()
-            ieds = parser.parse(self._scd_path)
+            parser, ied_elems = self._split()
+            ieds = parser.build_ieds(ied_elems)
             if not self._cancelled:
                 self.parsed.emit(ieds)
         except Exception as exc:
@@ -190,6 +221,10 @@ class MultiServerPanel(QWidget):
         timeout_ms = ipc_config.get("request_timeout_ms", 3000)
         
         self.instance_manager = ServerInstanceManager(socket_path, timeout_ms)
+        # 与 ServerPanel 保持同一组属性，多实例模式下没有单一的服务端代理
+        self.server = None
+        # SCD 的 XML 解析缓存，重复导入未修改的文件时跳过文件读取与 XML 解析
+        self._scd_cache: OrderedDict = OrderedDict()
         self._setup_manager_callbacks()
         
         self._init_ui()
@@ -497,7 +532,7 @@ class MultiServerPanel(QWidget):
         self._parse_progress.show()
 
         self._parse_thread = QThread(self)
-        self._parse_worker = _SCDParseWorker(file_path)
+        self._parse_worker = _SCDParseWorker(file_path, self._scd_cache)
         self._parse_worker.moveToThread(self._parse_thread)
         self._parse_thread.started.connect(self._parse_worker.run)
         self._parse_worker.parsed.connect(
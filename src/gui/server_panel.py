@@ -14,13 +14,16 @@ from typing import Any, Dict, Optional
 from datetime import datetime
 
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QTableWidgetItem, QHeaderView,
     QMessageBox, QFileDialog
 )
 from PyQt6 import uic
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+_SRC_ROOT = str(Path(__file__).parent.parent)
+if _SRC_ROOT not in sys.path:
+    sys.path.insert(0, _SRC_ROOT)
 
 from gui.data_tree_widget import DataTreeWidget
 from server.server_proxy import IEC61850ServerProxy, ServerConfig, ServerState
@@ -50,11 +53,17 @@ class ServerPanel(QWidget):
     _data_changed_signal = pyqtSignal(str, object, object)
     _instance_log_signal = pyqtSignal(str, str)
     
+    # 控制块属性表标题行字体（所有标题行共用）
+    _TITLE_FONT = QFont()
+    _TITLE_FONT.setBold(True)
+    
     def __init__(self, config: Dict, parent: Optional[QWidget] = None):
         super().__init__(parent)
         
         self.config = config
         self.server: Optional[IEC61850ServerProxy] = None
+        # 与 MultiServerPanel 保持同一组属性，单实例模式下没有实例管理器
+        self.instance_manager = None
         self._ied: Optional[IED] = None
         self._instance_id: str = "default"
         self._state_callback = None
@@ -415,10 +424,7 @@ class ServerPanel(QWidget):
             
             # 如果是标题行，设置粗体
             if prop.startswith("==="):
-                from PyQt6.QtGui import QFont
-                font = QFont()
-                font.setBold(True)
-                prop_item.setFont(font)
+                prop_item.setFont(self._TITLE_FONT)
                 prop_item.setBackground(Qt.GlobalColor.lightGray)
                 value_item.setBackground(Qt.GlobalColor.lightGray)
             
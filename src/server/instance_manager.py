@@ -16,6 +16,12 @@ from typing import Any, Callable, Dict, List, Optional
 import yaml
 from loguru import logger
 
+# 优先使用 libyaml 加速的 C 实现
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 from core.data_model import IED
 from core.data_model_manager import DataModelManager
 from server.server_proxy import IEC61850ServerProxy, ServerConfig, ServerState
@@ -375,7 +381,7 @@ class ServerInstanceManager:
             path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, allow_unicode=True, default_flow_style=False)
+                yaml.dump(data, f, Dumper=_YamlDumper, allow_unicode=True, default_flow_style=False)
             
             logger.info(f"保存 {len(instances_data)} 个服务器实例配置到 {file_path}")
             return True
@@ -402,7 +408,7 @@ class ServerInstanceManager:
                 return 0
             
             with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YamlLoader)
             
             if not data or data.get("type") != "server_instances":
                 logger.error("无效的服务器实例配置文件")
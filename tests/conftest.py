@@ -66,6 +66,15 @@ def test_data_dir():
     return data_dir
 
 
+@pytest.fixture(scope="session")
+def qapp():
+    """GUI 测试共用的 QApplication（无显示环境时使用 offscreen 平台）"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6.QtWidgets import QApplication
+    
+    return QApplication.instance() or QApplication([])
+
+
 # ============================================================================
 # 模块级 Fixtures
 # ============================================================================
@@ -0,0 +1,154 @@
+"""
+Tests for DataTreeWidget
+========================
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PyQt6.QtCore import Qt
+
+from gui.data_tree_widget import DataTreeWidget, parse_value_text
+
+
+class TestParseValueText:
+    """测试写入值的文本转换"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("true", True),
+        ("FALSE", False),
+        ("42", 42),
+        ("-7", -7),
+        ("3.5", 3.5),
+        ("1e3", 1000.0),
+        ("on", "on"),
+        ("1.2.3", "1.2.3"),
+    ])
+    def test_conversion(self, text, expected):
+        """测试按 bool -> int -> float -> str 的顺序转换"""
+        value = parse_value_text(text)
+        assert value == expected
+        assert type(value) is type(expected)
+
+
+def _make_ied() -> dict:
+    """构造测试用的 IED 数据字典"""
+    def do(cdc, **attributes):
+        return {"cdc": cdc, "attributes": attributes}
+
+    return {
+        "name": "IED1",
+        "logical_devices": {
+            "LD0": {
+                "logical_nodes": {
+                    "GGIO1": {
+                        "class": "GGIO",
+                        "data_objects": {
+                            "Ind1": do("SPS", stVal={"value": False, "type": "BOOLEAN"},
+                                       q={"value": 0, "type": "Quality"}),
+                            "Ind2": do("SPS", stVal={"value": False, "type": "BOOLEAN"}),
+                            "AnIn1": do("MV", mag={"type": "Struct", "attributes": {
+                                "f": {"value": 0.0, "type": "FLOAT32"},
+                            }}),
+                        },
+                    },
+                },
+            },
+        },
+    }
+
+
+class TestDataTreeWidget:
+    """测试数据树的延迟加载与搜索"""
+
+    @pytest.fixture
+    def widget(self, qapp):
+        """创建已加载测试 IED 的数据树"""
+        widget = DataTreeWidget()
+        widget.load_ied(_make_ied())
+        yield widget
+        widget.deleteLater()
+
+    def _items(self, widget):
+        """遍历树中全部节点"""
+        tree = widget.tree
+        stack = [tree.topLevelItem(i) for i in range(tree.topLevelItemCount())]
+        while stack:
+            item = stack.pop()
+            yield item
+            stack.extend(item.child(i) for i in range(item.childCount()))
+
+    def _find(self, widget, reference):
+        """按引用查找节点"""
+        for item in self._items(widget):
+            info = item.data(0, Qt.ItemDataRole.UserRole)
+            if info is not None and info.get("reference") == reference:
+                return item
+        return None
+
+    def test_children_are_deferred(self, widget):
+        """测试逻辑节点下的数据对象在展开前只有占位子项"""
+        ln_item = self._find(widget, "IED1LD0/GGIO1")
+
+        assert ln_item.childCount() == 1
+        assert ln_item.child(0).text(0) == "..."
+        assert self._find(widget, "IED1LD0/GGIO1.Ind1") is None
+
+        widget.tree.expandItem(ln_item)
+
+        assert ln_item.childCount() == 3
+        assert self._find(widget, "IED1LD0/GGIO1.Ind1") is not None
+
+    def test_pending_value_applied_on_materialize(self, widget):
+        """测试数据对象展开前收到的值在创建节点后显示"""
+        ref = "IED1LD0/GGIO1.Ind1.stVal"
+        widget.update_value(ref, True, quality=0x01)
+        widget.update_value("IED1LD0/GGIO1.AnIn1.f", 1.5)
+
+        assert ref in widget._pending_values
+        assert "IED1LD0/GGIO1.AnIn1.f" in widget._pending_values
+        widget.update_value("IED1LD0/GGIO1.Nope.stVal", True)
+        assert "IED1LD0/GGIO1.Nope.stVal" not in widget._pending_values
+
+        widget.tree.expandItem(self._find(widget, "IED1LD0/GGIO1"))
+        widget.tree.expandItem(self._find(widget, "IED1LD0/GGIO1.Ind1"))
+
+        item = widget._data_items[ref]
+        assert item.text(1) == widget._format_value(True)
+        assert ref not in widget._pending_values
+        assert widget.get_references().count(ref) == 1
+
+        # 结构属性的子属性引用挂在数据对象下（与 _add_data_attribute 一致），展开到叶子时显示
+        widget._materialize_all()
+        assert widget._data_items["IED1LD0/GGIO1.AnIn1.f"].text(1) == widget._format_value(1.5)
+        assert not widget._pending_values
+
+    def test_narrow_then_clear_search_restores_visibility(self, widget):
+        """测试逐步缩小搜索范围后清空搜索，全部节点恢复显示"""
+        widget._on_search("ind")
+        widget._on_search("ind1")
+
+        assert not self._find(widget, "IED1LD0/GGIO1.Ind1").isHidden()
+        assert self._find(widget, "IED1LD0/GGIO1.Ind2").isHidden()
+        assert self._find(widget, "IED1LD0/GGIO1.AnIn1").isHidden()
+        assert not self._find(widget, "IED1LD0/GGIO1").isHidden()
+
+        widget._on_search("")
+
+        hidden = [item.text(0) for item in self._items(widget) if item.isHidden()]
+        assert hidden == []
+
+    def test_narrowed_search_matches_full_search(self, widget):
+        """测试增量缩小搜索的结果与直接搜索一致"""
+        widget._on_search("a")
+        widget._on_search("an")
+        narrowed = {id(item) for item in self._items(widget) if item.isHidden()}
+
+        widget._on_search("")
+        widget._on_search("an")
+        direct = {id(item) for item in self._items(widget) if item.isHidden()}
+
+        assert narrowed == direct
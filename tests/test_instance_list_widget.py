@@ -0,0 +1,76 @@
+"""
+Tests for InstanceListWidget
+============================
+"""
+
+import pytest
+from unittest.mock import Mock
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtTest import QTest
+
+from gui.instance_list_widget import InstanceListWidget
+
+
+class TestInstanceListWidget:
+    """测试实例列表"""
+
+    @pytest.fixture
+    def widget(self, qapp):
+        """创建包含三个实例的列表"""
+        widget = InstanceListWidget("client")
+        for i in range(3):
+            widget.add_instance(f"id{i}", f"Client {i}", "DISCONNECTED")
+        yield widget
+        widget.deleteLater()
+
+    def test_clear_resets_model(self, widget):
+        """测试清空时一次重置模型，而不是逐行移除"""
+        removed = Mock()
+        reset = Mock()
+        widget.model.rowsRemoved.connect(removed)
+        widget.model.modelReset.connect(reset)
+        widget.select_instance("id1")
+
+        widget.clear()
+
+        assert widget.model.rowCount() == 0
+        assert widget.get_selected_id() is None
+        assert reset.call_count == 1
+        assert removed.call_count == 0
+
+    def test_keyboard_navigation_selects_instance(self, widget):
+        """测试键盘切换当前行时发出 instance_selected"""
+        selected = []
+        widget.instance_selected.connect(selected.append)
+        widget.select_instance("id0")
+        widget.list_view.setFocus()
+
+        QTest.keyClick(widget.list_view, Qt.Key.Key_Down)
+
+        assert selected == ["id0", "id1"]
+        assert widget.get_selected_id() == "id1"
+
+    def test_select_instance_emits_once(self, widget):
+        """测试程序选中实例时只发出一次信号"""
+        selected = []
+        widget.instance_selected.connect(selected.append)
+
+        widget.select_instance("id2")
+
+        assert selected == ["id2"]
+
+    def test_removing_selected_does_not_select_neighbour(self, widget):
+        """测试移除选中的实例后不会自动选中相邻实例"""
+        widget.select_instance("id1")
+        selected = []
+        widget.instance_selected.connect(selected.append)
+
+        widget.remove_instance("id1")
+
+        assert selected == []
+        assert widget.get_selected_id() is None
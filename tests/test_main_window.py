@@ -0,0 +1,204 @@
+"""
+Tests for MainWindow config helpers
+===================================
+"""
+
+import json
+import os
+
+import pytest
+from unittest.mock import Mock, patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from gui import main_window
+from gui.main_window import MainWindow, _dump_yaml, _load_yaml_file, _load_yaml_with_sidecar, _thaw
+
+
+class TestConfigSidecar:
+    """测试配置文件的JSON副本"""
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        """创建测试用的配置文件，副本写到临时目录"""
+        path = tmp_path / "config.yaml"
+        path.write_text("gui:\n  multi_instance: true\nports: [102, 103]\n", encoding="utf-8")
+        sidecar = tmp_path / "cache" / "config.yaml.json"
+        with patch.object(main_window, "_config_sidecar_path", return_value=sidecar):
+            yield path, sidecar
+
+    def test_fresh_sidecar_is_used(self, config_file):
+        """测试YAML未变化时直接读取JSON副本"""
+        path, sidecar = config_file
+
+        data = _load_yaml_with_sidecar(path)
+        assert sidecar.exists()
+        assert data["gui"]["multi_instance"] is True
+
+        with patch.object(main_window, "_load_yaml_file", side_effect=AssertionError("YAML parsed")):
+            cached = _load_yaml_with_sidecar(path)
+
+        assert cached == data
+        assert cached["ports"] == (102, 103)
+
+    def test_replaced_with_older_file_is_reparsed(self, config_file):
+        """测试换成修改时间更早的YAML文件时不读取旧副本"""
+        path, sidecar = config_file
+        _load_yaml_with_sidecar(path)
+        old_mtime = sidecar.stat().st_mtime_ns - 10**9
+
+        # 大小不变、修改时间更早（例如 git checkout、cp -p 或从备份恢复）
+        path.write_text(path.read_text(encoding="utf-8").replace("true", "null"), encoding="utf-8")
+        os.utime(path, ns=(old_mtime, old_mtime))
+
+        data = _load_yaml_with_sidecar(path)
+
+        assert data["gui"]["multi_instance"] is None
+        assert json.loads(sidecar.read_text(encoding="utf-8"))["config"]["gui"] == {"multi_instance": None}
+
+    def test_non_string_keys_skip_sidecar(self, config_file):
+        """测试非字符串键的配置不写出副本"""
+        path, sidecar = config_file
+        path.write_text("ports:\n  1: a\n", encoding="utf-8")
+
+        data = _load_yaml_with_sidecar(path)
+
+        assert data["ports"][1] == "a"
+        assert not sidecar.exists()
+
+
+class TestYamlSnapshot:
+    """测试YAML配置的只读快照与解析缓存"""
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        """创建测试用的配置文件"""
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            "server:\n  name: 测试\n  ports: [102, 103]\nclients:\n  - {host: 127.0.0.1, port: 102}\n",
+            encoding="utf-8",
+        )
+        yield path
+        main_window._yaml_cache.pop(str(path), None)
+
+    def test_snapshot_is_read_only(self, config_file):
+        """测试返回的快照不可修改"""
+        data = _load_yaml_file(config_file)
+
+        with pytest.raises(TypeError):
+            data["server"] = {}
+        with pytest.raises(TypeError):
+            data["server"]["name"] = "x"
+        with pytest.raises(TypeError):
+            data["server"]["ports"][0] = 1
+        with pytest.raises(AttributeError):
+            data["clients"].append({})
+
+    def test_thawed_snapshot_round_trips(self, config_file, tmp_path):
+        """测试解冻后的快照写出后再读入内容不变"""
+        data = _load_yaml_file(config_file)
+        plain = _thaw(data)
+        assert plain == {
+            "server": {"name": "测试", "ports": [102, 103]},
+            "clients": [{"host": "127.0.0.1", "port": 102}],
+        }
+
+        out = tmp_path / "out.yaml"
+        with open(out, "wb") as f:
+            _dump_yaml(data, f)
+
+        assert "测试" in out.read_text(encoding="utf-8")
+        assert _thaw(_load_yaml_file(out)) == plain
+        main_window._yaml_cache.pop(str(out), None)
+
+    def test_unchanged_file_hits_cache(self, config_file):
+        """测试文件未变化时返回同一份快照"""
+        first = _load_yaml_file(config_file)
+
+        with patch.object(main_window, "_load_yaml", side_effect=AssertionError("YAML parsed")):
+            assert _load_yaml_file(config_file) is first
+
+    def test_edit_invalidates_cache(self, config_file):
+        """测试编辑文件后重新解析"""
+        first = _load_yaml_file(config_file)
+
+        config_file.write_text("server: {name: changed}\n", encoding="utf-8")
+        second = _load_yaml_file(config_file)
+
+        assert second is not first
+        assert second["server"]["name"] == "changed"
+
+    def test_replaced_file_with_same_stat_is_reparsed(self, config_file):
+        """测试替换为大小与修改时间都相同的新文件时按 inode 重新解析"""
+        config_file.write_text("server: {name: changed}\n", encoding="utf-8")
+        _load_yaml_file(config_file)
+        st = config_file.stat()
+
+        replacement = config_file.with_name("replacement.yaml")
+        replacement.write_text("server: {name: CHANGED}\n", encoding="utf-8")
+        os.replace(replacement, config_file)
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert config_file.stat().st_size == st.st_size
+
+        assert _load_yaml_file(config_file)["server"]["name"] == "CHANGED"
+
+
+class _CoreLogLimiter:
+    """只带核心输出限流状态的 MainWindow 替身"""
+
+    CORE_LOG_RATE = 3
+
+    _on_core_output = MainWindow._on_core_output
+    _refill_core_log_tokens = MainWindow._refill_core_log_tokens
+    _flush_core_log_suppressed = MainWindow._flush_core_log_suppressed
+
+    def __init__(self):
+        self._core_log_tokens = self.CORE_LOG_RATE
+        self._core_log_suppressed = 0
+        self._core_log_timer = Mock()
+        self._core_log_timer.isActive.return_value = True
+        self.log_widget = Mock()
+
+
+class TestCoreLogLimiter:
+    """测试核心进程输出的令牌桶限流"""
+
+    @pytest.fixture
+    def limiter(self):
+        return _CoreLogLimiter()
+
+    def _warnings(self, limiter):
+        return [c.args[1] for c in limiter.log_widget.append_log.call_args_list]
+
+    def test_lines_within_budget_are_shown(self, limiter):
+        """测试额度内的输出原样显示"""
+        limiter._on_core_output("info", "a\nb\n")
+
+        limiter.log_widget.append_core_line.assert_called_once_with("info", "a\nb")
+        assert limiter._core_log_tokens == 1
+
+    def test_excess_lines_are_counted(self, limiter):
+        """测试超出额度的行被丢弃并计数（空行不计）"""
+        limiter._on_core_output("info", "a\nb\n\nc\nd\n")
+        limiter._on_core_output("error", "e\n\n")
+
+        limiter.log_widget.append_core_line.assert_called_once_with("info", "a\nb\nc")
+        assert limiter._core_log_suppressed == 2
+
+    def test_suppressed_count_reported_once_then_reset(self, limiter):
+        """测试丢弃的行数在窗口结束时提示一次，随后清零"""
+        limiter._on_core_output("info", "1\n2\n3\n4\n5\n")
+
+        limiter._refill_core_log_tokens()
+        limiter._refill_core_log_tokens()
+
+        assert self._warnings(limiter) == ["[core] 输出过多，已丢弃 2 行"]
+        assert limiter._core_log_suppressed == 0
+        assert limiter._core_log_tokens == limiter.CORE_LOG_RATE
+
+        limiter._on_core_output("info", "6\n7\n8\n9\n")
+        limiter._refill_core_log_tokens()
+
+        assert self._warnings(limiter)[-1] == "[core] 输出过多，已丢弃 1 行"
@@ -0,0 +1,112 @@
+"""
+Tests for SCD parser
+====================
+"""
+
+import os
+import shutil
+from collections import OrderedDict
+
+import pytest
+from unittest.mock import patch
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.scd_parser import SCDParser
+from gui.multi_server_panel import _SCDParseWorker
+
+
+def get_test_data_path(filename: str) -> str:
+    return os.path.join(os.path.dirname(__file__), "test_data", filename)
+
+
+def _strip_timestamps(value):
+    """去掉解析时生成的时间戳，便于比较两次解析的结果"""
+    if isinstance(value, dict):
+        return {k: _strip_timestamps(v) for k, v in value.items() if k != "timestamp"}
+    if isinstance(value, list):
+        return [_strip_timestamps(v) for v in value]
+    return value
+
+
+def _as_dicts(ieds):
+    return [_strip_timestamps(ied.to_dict()) for ied in ieds]
+
+
+@pytest.mark.parametrize("filename", ["report_goose.cid", "control.cid", "setting_group.cid"])
+def test_split_build_matches_full_parse(filename):
+    """测试 iterparse 拆分后构建的 IED 与整体解析结果一致"""
+    path = get_test_data_path(filename)
+    expected = SCDParser().parse(path)
+
+    parser = SCDParser()
+    ieds = parser.build_ieds(parser.split_ieds(path))
+
+    assert len(ieds) == len(expected) > 0
+    assert _as_dicts(ieds) == _as_dicts(expected)
+
+
+def test_split_keeps_communication_and_templates():
+    """测试拆分时保留 Communication 与 DataTypeTemplates 节点"""
+    path = get_test_data_path("report_goose.cid")
+    parser = SCDParser()
+    ieds = parser.build_ieds(parser.split_ieds(path))
+
+    assert parser._communication_element is not None
+    assert parser._dataTypeTemplate_element is not None
+    # Communication 中的 MMS 地址已关联到 AccessPoint
+    assert ieds[0].get_listen_ip() == SCDParser().parse(path)[0].get_listen_ip() == "10.0.0.2"
+
+
+class TestSCDParseCache:
+    """测试导入 SCD 时的解析缓存"""
+
+    @pytest.fixture
+    def scd_file(self, tmp_path):
+        path = tmp_path / "model.cid"
+        shutil.copy(get_test_data_path("report_goose.cid"), path)
+        return path
+
+    def _run(self, path, cache):
+        results = []
+        worker = _SCDParseWorker(str(path), cache)
+        worker.parsed.connect(results.append)
+        worker.run()
+        return results[0]
+
+    def test_unchanged_file_hits(self, scd_file):
+        """测试文件未变化时不再解析 XML，且每次得到新的模型"""
+        cache = OrderedDict()
+        with patch.object(SCDParser, "split_ieds", autospec=True, side_effect=SCDParser.split_ieds) as split:
+            first = self._run(scd_file, cache)
+            second = self._run(scd_file, cache)
+
+        assert split.call_count == 1
+        assert second[0] is not first[0]
+        assert _as_dicts(second) == _as_dicts(first)
+
+    def test_mtime_change_misses(self, scd_file):
+        """测试修改时间变化后重新解析"""
+        cache = OrderedDict()
+        with patch.object(SCDParser, "split_ieds", autospec=True, side_effect=SCDParser.split_ieds) as split:
+            self._run(scd_file, cache)
+            st = scd_file.stat()
+            os.utime(scd_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            self._run(scd_file, cache)
+
+        assert split.call_count == 2
+
+    def test_size_change_misses(self, scd_file):
+        """测试文件大小变化后重新解析"""
+        cache = OrderedDict()
+        with patch.object(SCDParser, "split_ieds", autospec=True, side_effect=SCDParser.split_ieds) as split:
+            self._run(scd_file, cache)
+            st = scd_file.stat()
+            with open(scd_file, "a", encoding="utf-8") as f:
+                f.write("\n")
+            os.utime(scd_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+            self._run(scd_file, cache)
+
+        assert split.call_count == 2